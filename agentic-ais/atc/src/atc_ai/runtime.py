@@ -93,7 +93,7 @@ class AtcRuntime:
         self._monitor_task: asyncio.Task[None] | None = None
         self._monitor_stop_event = asyncio.Event()
         self._active_clearance: ClearanceTargets | None = None
-        self._last_alert_epoch: dict[str, float] = {}
+        self._last_alert_at: dict[str, float] = {}
         self._last_processed_transmission_epoch = 0.0
         self._ops = MonitorOpsState()
 
@@ -252,12 +252,12 @@ class AtcRuntime:
         if not alerts:
             return
 
-        now = time.time()
+        now = time.monotonic()
         for alert in alerts:
-            last = self._last_alert_epoch.get(alert, 0.0)
+            last = self._last_alert_at.get(alert, float("-inf"))
             if now - last < ALERT_COOLDOWN_SEC:
                 continue
-            self._last_alert_epoch[alert] = now
+            self._last_alert_at[alert] = now
             print(f"[MONITOR] Pilot deviation: {alert}")
             if alert.startswith("frequency mismatch"):
                 await self._maybe_transmit_frequency_reminder()
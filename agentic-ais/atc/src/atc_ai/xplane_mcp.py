@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import asyncio
 import json
+import random
+import re
+import time
 from contextlib import suppress
 from typing import Any
 
@@ -21,6 +24,19 @@ DEFAULT_ATC_DATAREFS: dict[str, str] = {
     "on_ground": "sim/flightmodel/failures/onground_any",
 }
 
+AIRCRAFT_STATE_TOOL_REPROBE_SEC = 30.0
+MCP_MAX_RETRIES = 5
+MCP_RETRY_DELAY_CAP_SEC = 2.0
+# After this many consecutive calls give up on transient errors, fail fast until the cooldown ends.
+MCP_BREAKER_FAILURE_THRESHOLD = 3
+MCP_BREAKER_COOLDOWN_SEC = 10.0
+
+_NON_RETRYABLE_RE = re.compile(r"invalid_params|dataref not found", re.IGNORECASE)
+_RETRYABLE_RE = re.compile(
+    r"cancel|timed out|timeout|temporarily unavailable|connection|transport|broken pipe|eof",
+    re.IGNORECASE,
+)
+
 
 class XPlaneMCPClient:
     def __init__(self, sse_url: str) -> None:
@@ -29,8 +45,20 @@ class XPlaneMCPClient:
         self._session_cm: Any | None = None
         self._session: ClientSession | None = None
         self._session_lock = asyncio.Lock()
+        self._aircraft_state_tool_supported = True
+        self._aircraft_state_tool_retry_at = 0.0
+        self._consecutive_failures = 0
+        self._breaker_open_until = 0.0
 
     async def connect(self) -> None:
+        async with self._session_lock:
+            await self._connect()
+
+    async def _connect(self) -> None:
+        self._aircraft_state_tool_supported = True
+        self._aircraft_state_tool_retry_at = 0.0
+        self._consecutive_failures = 0
+        self._breaker_open_until = 0.0
         self._sse_cm = sse_client(self._sse_url)
         read_stream, write_stream = await self._sse_cm.__aenter__()
         self._session_cm = ClientSession(read_stream, write_stream)
@@ -38,6 +66,10 @@ class XPlaneMCPClient:
         await self._session.initialize()
 
     async def close(self) -> None:
+        async with self._session_lock:
+            await self._close()
+
+    async def _close(self) -> None:
         if self._session_cm is not None:
             with suppress(Exception):
                 await self._session_cm.__aexit__(None, None, None)
@@ -49,31 +81,49 @@ class XPlaneMCPClient:
         self._sse_cm = None
 
     async def call_tool(self, name: str, arguments: dict[str, Any] | None = None) -> dict[str, Any]:
+        return _decode_tool_result(await self._call_tool_raw(name, arguments))
+
+    async def _call_tool_raw(self, name: str, arguments: dict[str, Any] | None = None) -> Any:
         if self._session is None:
             raise RuntimeError("MCP session is not connected.")
+        if time.monotonic() < self._breaker_open_until:
+            raise RuntimeError(
+                f"MCP circuit open after {self._consecutive_failures} consecutive failed calls."
+            )
 
         args = arguments or {}
         retry = 0
         while True:
             try:
-                async with self._session_lock:
-                    result = await self._session.call_tool(name, arguments=args)
-                payload = _decode_tool_result(result)
-                return payload
+                result = await self._session.call_tool(name, arguments=args)
+                self._consecutive_failures = 0
+                return result
             except asyncio.CancelledError:
                 current_task = asyncio.current_task()
                 if current_task is not None and current_task.cancelling() > 0:
                     raise
+                if retry >= MCP_MAX_RETRIES:
+                    self._record_transient_failure()
+                    raise
                 retry += 1
                 await asyncio.sleep(_retry_delay(retry))
                 continue
             except Exception as exc:  # noqa: BLE001
                 if not _is_retryable_mcp_error(exc):
                     raise
+                if retry >= MCP_MAX_RETRIES:
+                    self._record_transient_failure()
+                    raise
                 retry += 1
                 await asyncio.sleep(_retry_delay(retry))
                 continue
 
+    def _record_transient_failure(self) -> None:
+        # Only exhausted transient retries count; tool-level errors mean the server is answering.
+        self._consecutive_failures += 1
+        if self._consecutive_failures >= MCP_BREAKER_FAILURE_THRESHOLD:
+            self._breaker_open_until = time.monotonic() + MCP_BREAKER_COOLDOWN_SEC
+
     async def read_dataref(self, name: str, mode: str = "auto") -> dict[str, Any]:
         return await self.call_tool("xplm_dataref_get", {"name": name, "mode": mode})
 
@@ -81,27 +131,45 @@ class XPlaneMCPClient:
         return await self.call_tool("xplm_speak_string", {"message": message})
 
     async def fetch_aircraft_state(self) -> dict[str, Any]:
-        try:
-            return await self.call_tool("fetch_aircraft_state", {})
-        except asyncio.CancelledError:
-            raise
-        except Exception:  # noqa: BLE001
-            # Backward compatibility for MCP servers that do not expose this tool yet.
-            pass
+        if (
+            self._aircraft_state_tool_supported
+            and time.monotonic() >= self._aircraft_state_tool_retry_at
+        ):
+            try:
+                result = await self._call_tool_raw("fetch_aircraft_state", {})
+                # Servers usually report an unknown tool as an isError result, not a raised error.
+                error_text = _tool_error_text(result)
+                if error_text is not None:
+                    raise RuntimeError(error_text)
+                return _decode_tool_result(result)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # noqa: BLE001
+                if _is_unknown_tool_error(exc):
+                    # Older MCP servers do not expose this tool; use per-dataref reads
+                    # until the next connect().
+                    self._aircraft_state_tool_supported = False
+                else:
+                    # Server-side failures (e.g. during aircraft load) are not retried by
+                    # call_tool; fall back for a while, then probe the batch tool again.
+                    self._aircraft_state_tool_retry_at = (
+                        time.monotonic() + AIRCRAFT_STATE_TOOL_REPROBE_SEC
+                    )
 
         async def _fetch_one(label: str, dataref_name: str) -> tuple[str, Any]:
             try:
                 result = await self.read_dataref(dataref_name, mode="auto")
-                return label, result.get("value")
-            except Exception as exc:  # noqa: BLE001
-                return label, {"error": str(exc), "dataref": dataref_name}
+            except Exception:  # noqa: BLE001
+                return label, None
+            return label, result.get("value")
 
         tasks = [
             _fetch_one(label, dataref_name)
             for label, dataref_name in DEFAULT_ATC_DATAREFS.items()
         ]
         pairs = await asyncio.gather(*tasks)
-        state = dict(pairs)
+        # Unreadable datarefs are left out; consumers read the state with .get().
+        state = {label: value for label, value in pairs if value is not None}
 
         with suppress(Exception):
             state["gps_destination"] = await self.call_tool("xplm_gps_destination", {})
@@ -112,9 +180,14 @@ class XPlaneMCPClient:
 
 
 def _decode_tool_result(result: Any) -> dict[str, Any]:
-    content = getattr(result, "content", None)
-    if content is None and isinstance(result, dict):
+    if isinstance(result, dict):
+        structured = result.get("structuredContent")
         content = result.get("content")
+    else:
+        structured = getattr(result, "structuredContent", None)
+        content = getattr(result, "content", None)
+    if isinstance(structured, dict):
+        return structured
 
     if not content:
         return {}
@@ -131,6 +204,19 @@ def _decode_tool_result(result: Any) -> dict[str, Any]:
     return {"content": [str(c) for c in content]}
 
 
+def _tool_error_text(result: Any) -> str | None:
+    if isinstance(result, dict):
+        is_error = result.get("isError")
+        content = result.get("content")
+    else:
+        is_error = getattr(result, "isError", None)
+        content = getattr(result, "content", None)
+    if not is_error:
+        return None
+    texts = [text for text in (_extract_text(item) for item in content or []) if text]
+    return " ".join(texts) or "MCP tool returned an error result."
+
+
 def _extract_text(item: Any) -> str | None:
     if isinstance(item, dict):
         text = item.get("text")
@@ -154,23 +240,20 @@ def _try_parse_json(text: str) -> dict[str, Any] | None:
         return None
 
 
-def _is_retryable_mcp_error(exc: Exception) -> bool:
+def _is_unknown_tool_error(exc: Exception) -> bool:
     text = str(exc).lower()
-    if "invalid_params" in text or "dataref not found" in text:
+    return "tool not found" in text or "unknown tool" in text or "method not found" in text
+
+
+def _is_retryable_mcp_error(exc: Exception) -> bool:
+    text = str(exc)
+    if _NON_RETRYABLE_RE.search(text):
         return False
-    retry_markers = (
-        "cancel",
-        "timed out",
-        "timeout",
-        "temporarily unavailable",
-        "connection",
-        "transport",
-        "broken pipe",
-        "eof",
-    )
-    return any(marker in text for marker in retry_markers)
+    if isinstance(exc, (TimeoutError, ConnectionError, EOFError)):
+        return True
+    return _RETRYABLE_RE.search(text) is not None
 
 
 def _retry_delay(retry: int) -> float:
-    # Short capped backoff to absorb transient MCP/tool cancellations.
-    return min(0.2 * retry, 2.0)
+    # Jittered exponential backoff, capped after jitter so no wait exceeds the cap.
+    return min(MCP_RETRY_DELAY_CAP_SEC, 0.2 * 2 ** (retry - 1) * (0.5 + random.random()))
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import sys
+import unittest
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from atc_ai.xplane_mcp import (
+    DEFAULT_ATC_DATAREFS,
+    MCP_BREAKER_FAILURE_THRESHOLD,
+    MCP_MAX_RETRIES,
+    MCP_RETRY_DELAY_CAP_SEC,
+    XPlaneMCPClient,
+    _decode_tool_result,
+    _is_retryable_mcp_error,
+    _retry_delay,
+)
+
+
+class _FakeSession:
+    def __init__(self, batch_error: str | None, batch_error_result: bool = False) -> None:
+        self.batch_error = batch_error
+        self.batch_error_result = batch_error_result
+        self.calls: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def call_tool(self, name: str, arguments: dict[str, Any] | None = None) -> dict[str, Any]:
+        self.calls.append(name)
+        if name == "fetch_aircraft_state":
+            if self.batch_error is not None:
+                if self.batch_error_result:
+                    return {"isError": True, "content": [{"type": "text", "text": self.batch_error}]}
+                raise RuntimeError(self.batch_error)
+            return {"content": [{"text": json.dumps({"on_ground": True, "source": "batch"})}]}
+        if name == "xplm_dataref_get":
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0)
+            self.in_flight -= 1
+            return {"content": [{"text": json.dumps({"value": 1.0})}]}
+        raise RuntimeError("Tool not found: " + name)
+
+
+def _client(session: _FakeSession) -> XPlaneMCPClient:
+    client = XPlaneMCPClient("http://127.0.0.1:8765/sse")
+    client._session = session
+    return client
+
+
+class TestFetchAircraftState(unittest.IsolatedAsyncioTestCase):
+    async def test_missing_batch_tool_latches_fallback(self) -> None:
+        session = _FakeSession(batch_error="Tool not found: fetch_aircraft_state")
+        client = _client(session)
+
+        state = await client.fetch_aircraft_state()
+        self.assertEqual(set(state), set(DEFAULT_ATC_DATAREFS))
+
+        client._aircraft_state_tool_retry_at = 0.0
+        await client.fetch_aircraft_state()
+        self.assertEqual(session.calls.count("fetch_aircraft_state"), 1)
+
+    async def test_unknown_tool_error_result_latches_fallback(self) -> None:
+        session = _FakeSession(batch_error="Unknown tool: fetch_aircraft_state", batch_error_result=True)
+        client = _client(session)
+
+        state = await client.fetch_aircraft_state()
+        self.assertEqual(set(state), set(DEFAULT_ATC_DATAREFS))
+        self.assertFalse(client._aircraft_state_tool_supported)
+
+    async def test_error_result_reprobes_batch_tool_after_backoff(self) -> None:
+        session = _FakeSession(batch_error="DataRef not found: sim/aircraft/loading", batch_error_result=True)
+        client = _client(session)
+
+        state = await client.fetch_aircraft_state()
+        self.assertEqual(set(state), set(DEFAULT_ATC_DATAREFS))
+        self.assertTrue(client._aircraft_state_tool_supported)
+        self.assertGreater(client._aircraft_state_tool_retry_at, 0.0)
+
+    async def test_server_error_reprobes_batch_tool_after_backoff(self) -> None:
+        session = _FakeSession(batch_error="DataRef not found: sim/aircraft/loading")
+        client = _client(session)
+
+        state = await client.fetch_aircraft_state()
+        self.assertEqual(set(state), set(DEFAULT_ATC_DATAREFS))
+
+        await client.fetch_aircraft_state()
+        self.assertEqual(session.calls.count("fetch_aircraft_state"), 1)
+
+        session.batch_error = None
+        client._aircraft_state_tool_retry_at = 0.0
+        state = await client.fetch_aircraft_state()
+        self.assertEqual(state.get("source"), "batch")
+        self.assertEqual(session.calls.count("fetch_aircraft_state"), 2)
+
+    async def test_fallback_dataref_reads_overlap(self) -> None:
+        session = _FakeSession(batch_error="Tool not found: fetch_aircraft_state")
+        client = _client(session)
+
+        await client.fetch_aircraft_state()
+        self.assertEqual(session.max_in_flight, len(DEFAULT_ATC_DATAREFS))
+
+
+class _DeadSession:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def call_tool(self, name: str, arguments: dict[str, Any] | None = None) -> dict[str, Any]:
+        self.calls += 1
+        raise RuntimeError("connection refused")
+
+
+class TestCallToolRetry(unittest.IsolatedAsyncioTestCase):
+    async def test_transient_errors_stop_after_max_retries(self) -> None:
+        session = _DeadSession()
+        client = XPlaneMCPClient("http://127.0.0.1:8765/sse")
+        client._session = session
+
+        with mock.patch("atc_ai.xplane_mcp._retry_delay", return_value=0.0):
+            with self.assertRaises(RuntimeError):
+                await client.call_tool("xplm_dataref_get", {"name": "sim/test"})
+        self.assertEqual(session.calls, MCP_MAX_RETRIES + 1)
+
+    async def test_breaker_fails_fast_until_cooldown(self) -> None:
+        session = _DeadSession()
+        client = _client(session)
+
+        with mock.patch("atc_ai.xplane_mcp._retry_delay", return_value=0.0):
+            for _ in range(MCP_BREAKER_FAILURE_THRESHOLD):
+                with self.assertRaises(RuntimeError):
+                    await client.call_tool("xplm_dataref_get", {"name": "sim/test"})
+            tripped_calls = session.calls
+
+            with self.assertRaisesRegex(RuntimeError, "circuit open"):
+                await client.call_tool("xplm_dataref_get", {"name": "sim/test"})
+            self.assertEqual(session.calls, tripped_calls)
+
+            client._breaker_open_until = 0.0
+            with self.assertRaises(RuntimeError):
+                await client.call_tool("xplm_dataref_get", {"name": "sim/test"})
+            self.assertEqual(session.calls, tripped_calls + MCP_MAX_RETRIES + 1)
+
+    async def test_success_resets_breaker_count(self) -> None:
+        session = _FakeSession(batch_error=None)
+        client = _client(session)
+        client._consecutive_failures = MCP_BREAKER_FAILURE_THRESHOLD - 1
+
+        await client.call_tool("xplm_dataref_get", {"name": "sim/test"})
+        self.assertEqual(client._consecutive_failures, 0)
+
+    async def test_application_errors_do_not_trip_breaker(self) -> None:
+        session = _FakeSession(batch_error="DataRef not found: sim/foo")
+        client = _client(session)
+
+        for _ in range(MCP_BREAKER_FAILURE_THRESHOLD + 1):
+            with self.assertRaises(RuntimeError):
+                await client.call_tool("fetch_aircraft_state")
+        self.assertEqual(session.calls.count("fetch_aircraft_state"), MCP_BREAKER_FAILURE_THRESHOLD + 1)
+
+    def test_retry_delay_is_capped(self) -> None:
+        with mock.patch("atc_ai.xplane_mcp.random.random", return_value=0.999):
+            for retry in range(1, 10):
+                self.assertLessEqual(_retry_delay(retry), MCP_RETRY_DELAY_CAP_SEC)
+        self.assertGreaterEqual(_retry_delay(1), 0.1)
+
+    def test_retryable_error_classification(self) -> None:
+        self.assertTrue(_is_retryable_mcp_error(BrokenPipeError()))
+        self.assertTrue(_is_retryable_mcp_error(TimeoutError()))
+        self.assertTrue(_is_retryable_mcp_error(RuntimeError("SSE Transport closed")))
+        self.assertFalse(_is_retryable_mcp_error(RuntimeError("DataRef not found: sim/foo")))
+        self.assertFalse(_is_retryable_mcp_error(ConnectionError("INVALID_PARAMS")))
+        self.assertFalse(_is_retryable_mcp_error(ValueError("bad argument")))
+
+
+class TestDecodeToolResult(unittest.TestCase):
+    def test_nan_value_decodes_to_dict(self) -> None:
+        out = _decode_tool_result({"content": [{"text": '{"on_ground": NaN}'}]})
+        self.assertTrue(math.isnan(out["on_ground"]))
+
+    def test_plain_text_result(self) -> None:
+        out = _decode_tool_result({"content": [{"text": "spoken"}]})
+        self.assertEqual(out, {"text": "spoken"})
+
+    def test_structured_content_skips_text_parse(self) -> None:
+        out = _decode_tool_result({"structuredContent": {"on_ground": True}, "content": [{"text": "{}"}]})
+        self.assertEqual(out, {"on_ground": True})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import re
 import time
@@ -13,10 +14,13 @@ from autogen_agentchat.messages import BaseAgentEvent, BaseChatMessage
 from autogen_agentchat.teams import SelectorGroupChat
 from autogen_core.models import ChatCompletionClient
 
+from cfi_ai import json_codec
 from cfi_ai.config import CfiConfig
 from cfi_ai.copilot_autogen_client import CopilotAutoGenClient
 from cfi_ai.memory.base import MemoryProvider
 from cfi_ai.types import (
+    DEFAULT_HAZARD_THRESHOLDS,
+    HAZARD_RULE_IDS,
     FlightPhase,
     FlightSnapshot,
     HazardProfile,
@@ -26,6 +30,8 @@ from cfi_ai.types import (
 )
 
 
+_KNOWN_HAZARD_RULES: frozenset[str] = frozenset(HAZARD_RULE_IDS)
+
 PHASE_PROMPT_FILE: dict[FlightPhase, str] = {
     FlightPhase.PREFLIGHT: "phase_preflight.md",
     FlightPhase.TAXI_OUT: "phase_taxi_out.md",
@@ -128,7 +134,8 @@ class CfiAgentTeam:
             provider_base_url=self._config.autogen_base_url,
             provider_bearer_token=self._config.autogen_api_key,
         )
-        self._build_agents_and_team()
+        master_prompt, phase_prompts = await asyncio.to_thread(_load_prompts)
+        self._build_agents_and_team(master_prompt, phase_prompts)
 
     async def stop(self) -> None:
         if self._model_client is not None:
@@ -230,11 +237,10 @@ class CfiAgentTeam:
         if not isinstance(speech_raw, dict):
             return {}
 
-        allowed_rules = set(HazardProfile().enabled_rules)
         out: dict[str, list[str]] = {}
         for key, value in speech_raw.items():
             rule = str(key).strip()
-            if rule not in allowed_rules or not isinstance(value, list):
+            if rule not in _KNOWN_HAZARD_RULES or not isinstance(value, list):
                 continue
             cleaned = _parse_speech_variants(value)
             if cleaned:
@@ -400,18 +406,18 @@ class CfiAgentTeam:
             raw_llm_output=raw_text,
         )
 
-    def _build_agents_and_team(self) -> None:
+    def _build_agents_and_team(
+        self,
+        master_prompt: str,
+        phase_prompts: dict[FlightPhase, str],
+    ) -> None:
         if self._model_client is None:
             raise RuntimeError("Model client is not initialized.")
 
-        prompt_root = Path(__file__).resolve().parent / "prompts"
-        master_prompt = (prompt_root / "master_cfi.md").read_text(encoding="utf-8").strip()
-
         self._agents.clear()
         self._phase_to_agent_name.clear()
 
-        for phase, prompt_file in PHASE_PROMPT_FILE.items():
-            phase_prompt = (prompt_root / prompt_file).read_text(encoding="utf-8").strip()
+        for phase, phase_prompt in phase_prompts.items():
             name = f"{phase.value}_expert"
             memory = self._memory_provider.attach_to_agent(name=name)
 
@@ -514,7 +520,18 @@ class CfiAgentTeam:
                     "source": getattr(msg, "source", "unknown"),
                     "content": _to_text(getattr(msg, "content", "")),
                 }
-                f.write(json.dumps(record, ensure_ascii=True) + "\n")
+                f.write(json_codec.dumps(record) + "\n")
+
+
+def _load_prompts() -> tuple[str, dict[FlightPhase, str]]:
+    # Blocking file reads; called via asyncio.to_thread from start().
+    prompt_root = Path(__file__).resolve().parent / "prompts"
+    master_prompt = (prompt_root / "master_cfi.md").read_text(encoding="utf-8").strip()
+    phase_prompts = {
+        phase: (prompt_root / prompt_file).read_text(encoding="utf-8").strip()
+        for phase, prompt_file in PHASE_PROMPT_FILE.items()
+    }
+    return master_prompt, phase_prompts
 
 
 def _to_text(content: Any) -> str:
@@ -580,8 +597,7 @@ def _default_hazard_profile_for_aircraft(
     aircraft_icao: str,
     aircraft_category: str,
 ) -> HazardProfile:
-    profile = HazardProfile()
-    thresholds = dict(profile.thresholds)
+    thresholds = dict(DEFAULT_HAZARD_THRESHOLDS)
     notes: list[str] = []
 
     cat = aircraft_category.strip().lower()
@@ -605,7 +621,7 @@ def _default_hazard_profile_for_aircraft(
         notes.append("Using GA baseline thresholds (C172-like) unless overridden.")
 
     return HazardProfile(
-        enabled_rules=list(profile.enabled_rules),
+        enabled_rules=list(HAZARD_RULE_IDS),
         thresholds=thresholds,
         notes=notes,
     )
@@ -625,13 +641,12 @@ def _parse_hazard_profile(
     if not isinstance(raw_hazard, dict):
         return default_profile
 
-    allowed_rules = set(HazardProfile().enabled_rules)
     enabled_rules_raw = raw_hazard.get("enabled_rules", [])
     enabled_rules: list[str] = []
     if isinstance(enabled_rules_raw, list):
         for item in enabled_rules_raw:
             rule = str(item).strip()
-            if rule in allowed_rules:
+            if rule in _KNOWN_HAZARD_RULES:
                 enabled_rules.append(rule)
     if not enabled_rules:
         enabled_rules = list(default_profile.enabled_rules)
@@ -666,7 +681,7 @@ def _parse_hazard_profile(
     if isinstance(speech_raw, dict):
         for key, value in speech_raw.items():
             rule = str(key).strip()
-            if rule not in allowed_rules or not isinstance(value, list):
+            if rule not in _KNOWN_HAZARD_RULES or not isinstance(value, list):
                 continue
             cleaned = _parse_speech_variants(value)
             if cleaned:
@@ -17,6 +17,10 @@ class HazardMonitor:
         self._urgent_cooldown_sec = urgent_cooldown_sec
         self._field_elevation_m: float | None = None
         self._hazard_profile = hazard_profile or HazardProfile()
+        self._enabled_rules: frozenset[str] = frozenset()
+        self._thresholds: dict[str, float] = {}
+        self._speech_variants: dict[str, tuple[str, ...]] = {}
+        self._index_profile()
         self._rng = rng or random.Random()
         self._last_variant_idx: dict[str, int] = {}
         self._taxi_in_rollout_cleared = False
@@ -25,6 +29,7 @@ class HazardMonitor:
         if hazard_profile is None:
             return
         self._hazard_profile = hazard_profile
+        self._index_profile()
         self._last_variant_idx.clear()
         self._taxi_in_rollout_cleared = False
 
@@ -44,6 +49,7 @@ class HazardMonitor:
             if cleaned:
                 merged[rule] = cleaned[:6]
         self._hazard_profile = replace(self._hazard_profile, speech_variants=merged)
+        self._index_speech_variants()
         self._last_variant_idx.clear()
 
     def evaluate(self, snapshot: FlightSnapshot, phase_state: PhaseState) -> list[HazardAlert]:
@@ -196,15 +202,32 @@ class HazardMonitor:
 
         return alerts
 
+    def _index_profile(self) -> None:
+        # Profiles only change on bootstrap/refresh, so resolve lookups once here
+        # instead of on every evaluated snapshot.
+        self._enabled_rules = frozenset(self._hazard_profile.enabled_rules)
+        thresholds: dict[str, float] = {}
+        for name, value in self._hazard_profile.thresholds.items():
+            try:
+                thresholds[name] = float(value)
+            except (TypeError, ValueError):
+                continue
+        self._thresholds = thresholds
+        self._index_speech_variants()
+
+    def _index_speech_variants(self) -> None:
+        variants: dict[str, tuple[str, ...]] = {}
+        for rule, lines in self._hazard_profile.speech_variants.items():
+            normalized = tuple(text for text in (_normalize_phrase(line) for line in lines) if text)
+            if normalized:
+                variants[rule] = normalized
+        self._speech_variants = variants
+
     def _enabled(self, rule_name: str) -> bool:
-        return rule_name in set(self._hazard_profile.enabled_rules)
+        return rule_name in self._enabled_rules
 
     def _threshold(self, name: str, fallback: float) -> float:
-        value = self._hazard_profile.thresholds.get(name, fallback)
-        try:
-            return float(value)
-        except (TypeError, ValueError):
-            return fallback
+        return self._thresholds.get(name, fallback)
 
     def _should_monitor_taxi_speed(
         self,
@@ -239,12 +262,7 @@ class HazardMonitor:
         return throttle >= thr_takeoff and (ias >= ias_takeoff or gs_kt >= gs_takeoff)
 
     def _speak_for(self, alert_id: str, fallback: str) -> str:
-        variants_raw = self._hazard_profile.speech_variants.get(alert_id, [])
-        variants: list[str] = []
-        for item in variants_raw:
-            text = _normalize_phrase(item)
-            if text:
-                variants.append(text)
+        variants = self._speech_variants.get(alert_id)
         if not variants:
             return _normalize_phrase(fallback) or fallback
         if len(variants) == 1:
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import json
+import math
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup (pip install -e ".[speedups]").
+    orjson = None
+
+
+def dumps(value: Any) -> str:
+    # Both paths emit compact UTF-8 JSON with non-finite floats as null, so log content does not
+    # depend on whether the speedups extra is installed (float spelling such as 1e20/1e+20 may differ).
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    try:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"), allow_nan=False)
+    except ValueError:
+        return json.dumps(_finite(value), ensure_ascii=False, separators=(",", ":"), allow_nan=False)
+
+
+def _finite(value: Any) -> Any:
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(item) for item in value]
+    return value
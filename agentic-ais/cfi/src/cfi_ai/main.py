@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import logging
+import sys
 
 from cfi_ai.config import CfiConfig
 from cfi_ai.runtime import CfiRuntime
@@ -30,6 +32,7 @@ def _parse_args() -> argparse.Namespace:
 
 async def _run() -> None:
     args = _parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
 
     config = CfiConfig.from_env()
     config.validate()
@@ -43,7 +46,13 @@ async def _run() -> None:
 
 
 def cli_entrypoint() -> None:
-    asyncio.run(_run())
+    try:
+        import uvloop
+    except ImportError:  # uvloop is an optional speedup (pip install -e ".[speedups]").
+        asyncio.run(_run())
+        return
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        runner.run(_run())
 
 
 if __name__ == "__main__":
@@ -12,6 +12,9 @@ from mcp.client.sse import sse_client
 
 from cfi_ai.types import SpeechSink
 
+# Spoken-unit expansions, matched in one pass: "<n> kt|kts|fpm", bare "kt" and "AGL".
+_TTS_UNIT_RE = re.compile(r"\b(\d+(?:\.\d+)?)\s*(kts?|fpm)\b|\b(kt|agl)\b", re.IGNORECASE)
+
 
 class XPlaneMCPClient:
     def __init__(self, sse_url: str) -> None:
@@ -22,6 +25,10 @@ class XPlaneMCPClient:
         self._session_lock = asyncio.Lock()
 
     async def connect(self) -> None:
+        async with self._session_lock:
+            await self._connect()
+
+    async def _connect(self) -> None:
         self._sse_cm = sse_client(self._sse_url)
         read_stream, write_stream = await self._sse_cm.__aenter__()
         self._session_cm = ClientSession(read_stream, write_stream)
@@ -29,6 +36,10 @@ class XPlaneMCPClient:
         await self._session.initialize()
 
     async def close(self) -> None:
+        async with self._session_lock:
+            await self._close()
+
+    async def _close(self) -> None:
         if self._session_cm is not None:
             with suppress(Exception):
                 await self._session_cm.__aexit__(None, None, None)
@@ -44,8 +55,7 @@ class XPlaneMCPClient:
             raise RuntimeError("MCP session is not connected.")
 
         args = arguments or {}
-        async with self._session_lock:
-            result = await self._session.call_tool(name, arguments=args)
+        result = await self._session.call_tool(name, arguments=args)
         return _decode_tool_result(result)
 
     async def speak(self, message: str) -> dict[str, Any]:
@@ -86,9 +96,10 @@ class McpSpeechSink(SpeechSink):
         self._nonurgent_cooldown_sec = nonurgent_cooldown_sec
         self._dry_run = dry_run
 
+        # Cooldowns run on the monotonic clock so wall-clock jumps cannot mute or repeat callouts.
         self._last_urgent_by_key: dict[str, float] = {}
-        self._last_nonurgent_epoch = 0.0
-        self._last_urgent_epoch = 0.0
+        self._last_nonurgent_at = float("-inf")
+        self._last_urgent_at = float("-inf")
 
     async def start(self) -> None:
         await self._mcp.connect()
@@ -97,46 +108,51 @@ class McpSpeechSink(SpeechSink):
         await self._mcp.close()
 
     async def speak_urgent(self, text: str, key: str) -> bool:
-        now = time.time()
-        last = self._last_urgent_by_key.get(key, 0.0)
+        now = time.monotonic()
+        last = self._last_urgent_by_key.get(key, float("-inf"))
         if now - last < self._urgent_cooldown_sec:
             return False
 
         if self._dry_run:
             self._last_urgent_by_key[key] = now
-            self._last_urgent_epoch = now
+            self._last_urgent_at = now
             return True
 
         result = await self._mcp.speak(text)
         ok = bool(result.get("success", False))
         if ok:
             self._last_urgent_by_key[key] = now
-            self._last_urgent_epoch = now
+            self._last_urgent_at = now
         return ok
 
     async def speak_nonurgent(self, text: str) -> bool:
-        now = time.time()
-        if now - self._last_nonurgent_epoch < self._nonurgent_cooldown_sec:
+        now = time.monotonic()
+        if now - self._last_nonurgent_at < self._nonurgent_cooldown_sec:
             return False
 
         if self._dry_run:
-            self._last_nonurgent_epoch = now
+            self._last_nonurgent_at = now
             return True
 
         result = await self._mcp.speak(text)
         ok = bool(result.get("success", False))
         if ok:
-            self._last_nonurgent_epoch = now
+            self._last_nonurgent_at = now
         return ok
 
     def recent_urgent(self, within_sec: float) -> bool:
-        return (time.time() - self._last_urgent_epoch) <= max(0.0, within_sec)
+        return (time.monotonic() - self._last_urgent_at) <= max(0.0, within_sec)
 
 
 def _decode_tool_result(result: Any) -> dict[str, Any]:
-    content = getattr(result, "content", None)
-    if content is None and isinstance(result, dict):
+    if isinstance(result, dict):
+        structured = result.get("structuredContent")
         content = result.get("content")
+    else:
+        structured = getattr(result, "structuredContent", None)
+        content = getattr(result, "content", None)
+    if isinstance(structured, dict):
+        return structured
 
     if not content:
         return {}
@@ -177,23 +193,15 @@ def _try_parse_json(text: str) -> dict[str, Any] | None:
 
 
 def _normalize_tts_message(text: str) -> str:
-    message = " ".join(str(text).split()).strip()
+    message = " ".join(str(text).split())
     if not message:
         return ""
+    return _TTS_UNIT_RE.sub(_expand_tts_unit, message)
+
 
-    message = re.sub(
-        r"\b(\d+(?:\.\d+)?)\s*kts?\b",
-        r"\1 knots",
-        message,
-        flags=re.IGNORECASE,
-    )
-    message = re.sub(r"\bkt\b", "knots", message, flags=re.IGNORECASE)
-    message = re.sub(
-        r"\b(\d+(?:\.\d+)?)\s*fpm\b",
-        r"\1 feet per minute",
-        message,
-        flags=re.IGNORECASE,
-    )
-    message = re.sub(r"\bAGL\b", "above ground level", message, flags=re.IGNORECASE)
-    message = re.sub(r"\s+", " ", message).strip()
-    return message
+def _expand_tts_unit(match: re.Match[str]) -> str:
+    number = match.group(1)
+    if number is not None:
+        unit = "feet per minute" if match.group(2).lower() == "fpm" else "knots"
+        return f"{number} {unit}"
+    return "knots" if match.group(3).lower() == "kt" else "above ground level"
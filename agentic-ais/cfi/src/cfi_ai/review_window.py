@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from statistics import fmean
 
-from cfi_ai.types import FlightPhase, FlightSnapshot, ReviewWindow
+from cfi_ai.types import METERS_TO_FEET, FlightPhase, FlightSnapshot, ReviewWindow
 
 
 class ReviewWindowBuilder:
@@ -13,19 +13,29 @@ class ReviewWindowBuilder:
         if not snapshots:
             raise ValueError("Cannot build review window from an empty snapshot list.")
 
+        ias_values: list[float] = []
+        vs_values: list[float] = []
+        roll_values: list[float] = []
+        elevation_values: list[float] = []
         for s in snapshots:
-            gs_kt = (s.groundspeed_m_s or 0.0) * 1.94384
-            if s.on_ground and s.elevation_m is not None and gs_kt < 25:
-                self._field_elevation_m = s.elevation_m
-
-        ias_values = [s.indicated_airspeed_kt for s in snapshots if s.indicated_airspeed_kt is not None]
-        vs_values = [s.vertical_speed_fpm for s in snapshots if s.vertical_speed_fpm is not None]
-        roll_values = [abs(s.roll_deg) for s in snapshots if s.roll_deg is not None]
-        agl_values = [
-            s.agl_ft(self._field_elevation_m)
-            for s in snapshots
-            if s.agl_ft(self._field_elevation_m) is not None
-        ]
+            if s.elevation_m is not None:
+                elevation_values.append(s.elevation_m)
+                if s.on_ground and (s.groundspeed_m_s or 0.0) * 1.94384 < 25:
+                    self._field_elevation_m = s.elevation_m
+            if s.indicated_airspeed_kt is not None:
+                ias_values.append(s.indicated_airspeed_kt)
+            if s.vertical_speed_fpm is not None:
+                vs_values.append(s.vertical_speed_fpm)
+            if s.roll_deg is not None:
+                roll_values.append(abs(s.roll_deg))
+
+        # AGL is a fixed offset from elevation, so its extremes come from the elevation extremes.
+        agl_values: list[float] = []
+        if elevation_values and self._field_elevation_m is not None:
+            agl_values = [
+                (min(elevation_values) - self._field_elevation_m) * METERS_TO_FEET,
+                (max(elevation_values) - self._field_elevation_m) * METERS_TO_FEET,
+            ]
 
         metrics: dict[str, float] = {
             "ias_min_kt": min(ias_values) if ias_values else 0.0,
@@ -2,13 +2,17 @@ from __future__ import annotations
 
 import asyncio
 import json
+import logging
 import re
 import time
+from collections import deque
 from contextlib import suppress
 from dataclasses import asdict, replace
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Protocol
+from typing import Any, Protocol, TextIO
 
+from cfi_ai import json_codec
 from cfi_ai.agent_team import CfiAgentTeam
 from cfi_ai.config import CfiConfig
 from cfi_ai.flight_phase import FlightPhaseTracker
@@ -29,6 +33,12 @@ from cfi_ai.types import (
 )
 from cfi_ai.xplane_udp import XPlaneUdpClient
 
+_log = logging.getLogger("cfi.runtime")
+
+LOG_FLUSH_INTERVAL_SEC = 0.2
+EVENT_LOOP_LAG_WARN_SEC = 0.1
+EVENT_LOOP_LAG_PROBE_SEC = 0.05
+
 AIRBORNE_PHASES: set[FlightPhase] = {
     FlightPhase.TAKEOFF,
     FlightPhase.INITIAL_CLIMB,
@@ -38,53 +48,80 @@ AIRBORNE_PHASES: set[FlightPhase] = {
     FlightPhase.LANDING,
 }
 
-PRIORITY_REVIEW_KEYWORDS: tuple[str, ...] = (
-    "high sink",
-    "sink rate",
-    "hard touchdown",
-    "steep bank",
-    "unstable",
-    "hazard",
-    "hazardous",
-    "risk",
-    "unsafe",
-    "low-energy",
-    "critical",
-    "immediate correction",
-    "immediate coaching",
-    "poor control",
-    "stall",
+PRIORITY_REVIEW_KEYWORDS: frozenset[str] = frozenset(
+    {
+        "high sink",
+        "sink rate",
+        "hard touchdown",
+        "steep bank",
+        "unstable",
+        "hazard",
+        "hazardous",
+        "risk",
+        "unsafe",
+        "low-energy",
+        "critical",
+        "immediate correction",
+        "immediate coaching",
+        "poor control",
+        "stall",
+    }
 )
 
-LOW_VALUE_COACH_MARKERS: tuple[str, ...] = (
-    "no evidence",
-    "no movement",
-    "no issues",
-    "no hazards",
-    "no hazard",
-    "awaiting",
-    "not assessable",
-    "not applicable",
-    "no data",
-    "stationary",
+LOW_VALUE_COACH_MARKERS: frozenset[str] = frozenset(
+    {
+        "no evidence",
+        "no movement",
+        "no issues",
+        "no hazards",
+        "no hazard",
+        "awaiting",
+        "not assessable",
+        "not applicable",
+        "no data",
+        "stationary",
+    }
 )
 
-ACTIONABLE_COACH_KEYWORDS: tuple[str, ...] = (
-    "maintain",
-    "focus",
-    "review",
-    "practice",
-    "correct",
-    "reduce",
-    "increase",
-    "hold",
-    "keep",
-    "use",
-    "monitor",
-    "recover",
-    "go-around",
-    "go around",
-    "let's",
+ACTIONABLE_COACH_KEYWORDS: frozenset[str] = frozenset(
+    {
+        "maintain",
+        "focus",
+        "review",
+        "practice",
+        "correct",
+        "reduce",
+        "increase",
+        "hold",
+        "keep",
+        "use",
+        "monitor",
+        "recover",
+        "go-around",
+        "go around",
+        "let's",
+    }
+)
+
+COACH_ADDRESS_TOKENS: frozenset[str] = frozenset({"you", "we", "let's"})
+
+_WORD_TOKEN_RE = re.compile(r"[a-z]+(?:'s)?")
+_REVIEW_PREFIX_RE = re.compile(r"^[A-Za-z ]{1,32} review:\s*", flags=re.IGNORECASE)
+_LEADING_CONJUNCTIONS: tuple[str, ...] = ("however", "but", "and")
+_LEADING_CONJUNCTION_RE = re.compile(r"^(however|but|and)\s*[:,\-]?\s*", flags=re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r"\s+")
+_NO_DETECTION_RE = re.compile(r"\bno\b.{0,35}\b(detected|observed|noted|issues?)\b")
+_HUMANIZE_REWRITES: tuple[tuple[re.Pattern[str], str], ...] = (
+    (re.compile(r"\([^)]{1,40}\)"), ""),
+    (re.compile(r"\bthis indicates\b", flags=re.IGNORECASE), "That means"),
+    (re.compile(r"\bit indicates\b", flags=re.IGNORECASE), "That means"),
+    (re.compile(r"\bwas observed\b", flags=re.IGNORECASE), "was noted"),
+    (re.compile(r"\bwere observed\b", flags=re.IGNORECASE), "were noted"),
+    (re.compile(r"\bwas detected\b", flags=re.IGNORECASE), "was noted"),
+    (re.compile(r"\bwere detected\b", flags=re.IGNORECASE), "were noted"),
+    (re.compile(r"\bimmediate coaching is needed on\b", flags=re.IGNORECASE), "Let's focus on"),
+    (re.compile(r"\brecommend\b", flags=re.IGNORECASE), "Let's"),
+    (re.compile(r"\bemphasize\b", flags=re.IGNORECASE), "Focus on"),
 )
 
 
@@ -103,13 +140,41 @@ class TeamRunner(Protocol):
 
 
 class JsonlLogger:
-    def __init__(self, path: str) -> None:
+    def __init__(
+        self,
+        path: str,
+        *,
+        max_pending: int = 256,
+        sink: list[dict[str, Any]] | None = None,
+    ) -> None:
         self._path = Path(path)
+        self._max_pending = max(1, max_pending)
+        self._pending: list[str] = []
+        self._fh: TextIO | None = None
+        self._sink = sink
 
     def write(self, payload: dict[str, Any]) -> None:
-        self._path.parent.mkdir(parents=True, exist_ok=True)
-        with self._path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(payload, ensure_ascii=True) + "\n")
+        if self._sink is not None:
+            self._sink.append(payload)
+        self._pending.append(json_codec.dumps(payload))
+        if len(self._pending) >= self._max_pending:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        if self._fh is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._fh = self._path.open("a", encoding="utf-8")
+        lines, self._pending = self._pending, []
+        self._fh.writelines(line + "\n" for line in lines)
+        self._fh.flush()
+
+    def close(self) -> None:
+        self.flush()
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
 
 
 class TelemetryCollector:
@@ -141,6 +206,7 @@ class CfiRuntime:
         speech_sink: SpeechSink | None = None,
         team_runner: TeamRunner | None = None,
         memory_provider: MemoryProvider | None = None,
+        events_sink: list[dict[str, Any]] | None = None,
     ) -> None:
         self._config = config
         self._nonurgent_speak_enabled = nonurgent_speak_enabled
@@ -179,11 +245,11 @@ class CfiRuntime:
         self._hazard_monitor = HazardMonitor(config.urgent_cooldown_sec)
         self._review_builder = ReviewWindowBuilder()
 
-        self._runtime_log = JsonlLogger(config.runtime_events_log_path)
-        telemetry_logger = JsonlLogger(config.telemetry_log_path)
+        self._runtime_log = JsonlLogger(config.runtime_events_log_path, sink=events_sink)
+        self._telemetry_log = JsonlLogger(config.telemetry_log_path)
         self._telemetry = TelemetryCollector(
             enabled=config.telemetry_enabled,
-            logger=telemetry_logger,
+            logger=self._telemetry_log,
         )
 
         self._stop_event = asyncio.Event()
@@ -198,26 +264,38 @@ class CfiRuntime:
         self._session_profile: SessionProfile | None = None
         self._hazard_events_count = 0
         self._hazard_alert_counts: dict[str, int] = {}
-        self._session_snapshots: list[FlightSnapshot] = []
+        self._session_snapshots: deque[FlightSnapshot] = deque(maxlen=100_000)
         self._phase_path: list[FlightPhase] = [FlightPhase.PREFLIGHT]
         self._saw_airborne_segment = False
         self._shutdown_candidate_since: float | None = None
         self._shutdown_debrief_emitted = False
         self._flight_index = 1
         self._hazard_phrase_refresh_task: asyncio.Task[None] | None = None
+        self._lag_probe: asyncio.TimerHandle | None = None
+        self._review_task: asyncio.Task[None] | None = None
+        self._team_lock = asyncio.Lock()
 
     async def start(self) -> None:
-        await self._start_with_retry(
-            label="X-Plane UDP",
-            starter=self._udp.start,
-        )
-        await self._start_with_retry(
-            label="X-Plane MCP speech",
-            starter=self._speech.start,
+        # UDP discovery and the MCP connection are independent; overlap their round trips.
+        udp_start = asyncio.create_task(
+            self._start_with_retry(
+                label="X-Plane UDP",
+                starter=self._udp.start,
+            )
         )
+        try:
+            await self._start_with_retry(
+                label="X-Plane MCP speech",
+                starter=self._speech.start,
+            )
+        except BaseException:
+            udp_start.cancel()
+            with suppress(asyncio.CancelledError, Exception):
+                await udp_start
+            raise
+        await udp_start
         await self._team.start()
         await self._bootstrap_session_profile()
-        self._start_hazard_phrase_refresh_loop()
 
     async def stop(self) -> None:
         if self._hazard_phrase_refresh_task is not None:
@@ -228,6 +306,15 @@ class CfiRuntime:
         await self._team.stop()
         await self._udp.stop()
         await self._speech.stop()
+        self._flush_logs()
+
+    def _flush_logs(self) -> None:
+        self._runtime_log.flush()
+        self._telemetry_log.flush()
+
+    def _close_logs(self) -> None:
+        self._runtime_log.close()
+        self._telemetry_log.close()
 
     def request_stop(self) -> None:
         self._stop_event.set()
@@ -238,78 +325,109 @@ class CfiRuntime:
         try:
             await self.start()
             started = True
-            start_epoch = time.time()
-            next_review_epoch = start_epoch + self._config.review_tick_sec
+            # Scheduling runs on the monotonic clock; wall-clock time is only used for log timestamps.
+            start_at = time.monotonic()
+            next_review_at = start_at + self._config.review_tick_sec
+            refresh_sec = max(0.1, self._config.hazard_phrase_refresh_sec)
+            next_refresh_at = start_at + refresh_sec
+            next_log_flush_at = start_at + LOG_FLUSH_INTERVAL_SEC
+            deadline_at = (
+                start_at + duration_sec if duration_sec is not None and duration_sec > 0 else None
+            )
+            if self._config.telemetry_enabled:
+                self._schedule_lag_probe()
 
             while not self._stop_event.is_set():
-                now = time.time()
-                if duration_sec is not None and duration_sec > 0:
-                    if now - start_epoch >= duration_sec:
-                        stop_reason = "duration_elapsed"
-                        break
+                now = time.monotonic()
+                if deadline_at is not None and now >= deadline_at:
+                    stop_reason = "duration_elapsed"
+                    break
 
                 snapshot = self._udp.latest()
                 if snapshot is not None and snapshot.timestamp_sec > self._last_snapshot_ts:
                     self._last_snapshot_ts = snapshot.timestamp_sec
                     await self._process_snapshot(snapshot)
 
-                if now >= next_review_epoch:
-                    await self._run_nonurgent_review(now)
-                    next_review_epoch = now + self._config.review_tick_sec
+                if now >= next_review_at:
+                    self._start_nonurgent_review(time.time())
+                    next_review_at = now + self._config.review_tick_sec
+
+                if now >= next_refresh_at:
+                    self._start_hazard_phrase_refresh()
+                    next_refresh_at = now + refresh_sec
 
-                await asyncio.sleep(0.05)
+                if now >= next_log_flush_at:
+                    self._flush_logs()
+                    next_log_flush_at = now + LOG_FLUSH_INTERVAL_SEC
+
+                wake_at = min(next_review_at, next_refresh_at, next_log_flush_at)
+                if deadline_at is not None:
+                    wake_at = min(wake_at, deadline_at)
+                timeout = max(0.0, wake_at - time.monotonic())
+                # Sleep until the UDP source ingests a datagram or the next timer is due.
+                await self._udp.wait_for_snapshot(timeout)
 
             if self._stop_event.is_set():
                 stop_reason = "stop_requested"
             if stop_reason == "unknown":
                 stop_reason = "loop_exit"
         finally:
-            if started:
-                with suppress(Exception):
-                    await self._run_shutdown_debrief(stop_reason)
-                await self.stop()
+            if self._lag_probe is not None:
+                self._lag_probe.cancel()
+                self._lag_probe = None
+            try:
+                if started:
+                    await self._cancel_nonurgent_review()
+                    with suppress(Exception):
+                        await self._run_shutdown_debrief(stop_reason)
+                    await self.stop()
+            finally:
+                self._close_logs()
+
+    def _schedule_lag_probe(self) -> None:
+        loop = asyncio.get_running_loop()
+        scheduled_at = loop.time() + EVENT_LOOP_LAG_PROBE_SEC
+        self._lag_probe = loop.call_at(scheduled_at, self._on_lag_probe, scheduled_at)
+
+    def _on_lag_probe(self, scheduled_at: float) -> None:
+        # A timer callback running well after its scheduled time means something blocked the event loop.
+        lag_sec = asyncio.get_running_loop().time() - scheduled_at
+        if lag_sec > EVENT_LOOP_LAG_WARN_SEC:
+            self._telemetry.emit("event_loop_lag_ms", lag_sec * 1000.0)
+        self._schedule_lag_probe()
 
     async def _process_snapshot(self, snapshot: Any) -> None:
         await self._maybe_start_new_flight_cycle(snapshot)
+        now = time.time()
 
         self._session_snapshots.append(snapshot)
-        if len(self._session_snapshots) > 100_000:
-            self._session_snapshots = self._session_snapshots[-100_000:]
 
         self._phase_state = self._phase_tracker.update(snapshot)
+        phase_value = self._phase_state.phase.value
         if (not snapshot.on_ground) or self._phase_state.phase in AIRBORNE_PHASES:
             self._saw_airborne_segment = True
 
         if self._phase_state.changed:
             if self._phase_path[-1] != self._phase_state.phase:
                 self._phase_path.append(self._phase_state.phase)
-            msg = (
-                f"[PHASE] {self._phase_state.previous_phase.value if self._phase_state.previous_phase else 'none'}"
-                f" -> {self._phase_state.phase.value}"
+            previous_value = (
+                self._phase_state.previous_phase.value if self._phase_state.previous_phase else None
             )
-            print(msg)
+            _log.info("[PHASE] %s -> %s", previous_value or "none", phase_value)
             self._runtime_log.write(
                 {
-                    "ts": time.time(),
+                    "ts": now,
                     "event": "phase_change",
-                    "phase": self._phase_state.phase.value,
-                    "previous_phase": (
-                        self._phase_state.previous_phase.value
-                        if self._phase_state.previous_phase
-                        else None
-                    ),
+                    "phase": phase_value,
+                    "previous_phase": previous_value,
                     "confidence": self._phase_state.confidence,
                 }
             )
             await self._memory.record_event(
                 "phase_change",
                 {
-                    "phase": self._phase_state.phase.value,
-                    "previous_phase": (
-                        self._phase_state.previous_phase.value
-                        if self._phase_state.previous_phase
-                        else None
-                    ),
+                    "phase": phase_value,
+                    "previous_phase": previous_value,
                     "confidence": self._phase_state.confidence,
                 },
             )
@@ -319,58 +437,97 @@ class CfiRuntime:
             self._hazard_events_count += 1
             self._hazard_alert_counts[alert.alert_id] = self._hazard_alert_counts.get(alert.alert_id, 0) + 1
             did_speak = await self._speech.speak_urgent(alert.speak_text, alert.alert_id)
+            alert_payload = alert.as_dict()
             self._runtime_log.write(
                 {
-                    "ts": time.time(),
+                    "ts": now,
                     "event": "hazard_alert",
-                    "phase": self._phase_state.phase.value,
-                    "alert": asdict(alert),
+                    "phase": phase_value,
+                    "alert": alert_payload,
                     "spoken": did_speak,
                 }
             )
             await self._memory.record_event(
                 "hazard_alert",
                 {
-                    "phase": self._phase_state.phase.value,
-                    "alert": asdict(alert),
+                    "phase": phase_value,
+                    "alert": alert_payload,
                     "spoken": did_speak,
                 },
             )
             if did_speak:
-                print(f"[URGENT] {alert.speak_text}")
+                _log.info("[URGENT] %s", alert.speak_text)
                 self._telemetry.emit("urgent_alert_spoken", 1.0, {"alert_id": alert.alert_id})
 
         await self._maybe_trigger_shutdown_debrief(snapshot)
 
-    async def _run_nonurgent_review(self, now_epoch: float) -> None:
+    def _start_nonurgent_review(self, now_epoch: float) -> None:
+        # The team review is an LLM round trip; keep it off the snapshot loop and run one at a time.
+        if self._review_task is not None and not self._review_task.done():
+            return
+        # Label the review with the phase and flight it covers, not whatever is current when it finishes.
+        self._review_task = asyncio.create_task(
+            self._nonurgent_review_worker(now_epoch, self._phase_state.phase, self._flight_index)
+        )
+
+    async def _cancel_nonurgent_review(self) -> None:
+        if self._review_task is not None:
+            self._review_task.cancel()
+            with suppress(asyncio.CancelledError, Exception):
+                await self._review_task
+        self._review_task = None
+
+    async def _nonurgent_review_worker(
+        self, now_epoch: float, phase: FlightPhase, flight_index: int
+    ) -> None:
+        try:
+            await self._run_nonurgent_review(now_epoch, phase, flight_index)
+        except Exception as exc:  # noqa: BLE001
+            self._runtime_log.write(
+                {
+                    "ts": time.time(),
+                    "event": "team_review_failed",
+                    "flight_index": flight_index,
+                    "phase": phase.value,
+                    "error": str(exc),
+                }
+            )
+
+    async def _run_nonurgent_review(
+        self, now_epoch: float, phase: FlightPhase, flight_index: int
+    ) -> None:
         snapshots = self._udp.window(self._config.review_window_sec)
         if not snapshots:
             return
 
-        review = self._review_builder.build(snapshots, self._phase_state.phase)
-        decision = await self._team.run_review(review, session_profile=self._session_profile)
+        review = self._review_builder.build(snapshots, phase)
+        async with self._team_lock:
+            decision = await self._team.run_review(review, session_profile=self._session_profile)
+        review_payload = review.as_dict()
+        phase_value = phase.value
+        decision_payload = decision.as_dict()
 
         self._runtime_log.write(
             {
                 "ts": now_epoch,
                 "event": "team_decision",
-                "flight_index": self._flight_index,
-                "phase": self._phase_state.phase.value,
-                "review_window": asdict(review),
-                "decision": asdict(decision),
+                "flight_index": flight_index,
+                "phase": phase_value,
+                "review_window": review_payload,
+                "decision": decision_payload,
             }
         )
 
         await self._memory.record_event(
             "team_decision",
             {
-                "phase": self._phase_state.phase.value,
-                "review_window": asdict(review),
-                "decision": asdict(decision),
+                "phase": phase_value,
+                "review_window": review_payload,
+                "decision": decision_payload,
             },
         )
 
-        print(f"[REVIEW] {decision.summary}")
+        _log.info("[REVIEW] %s", decision.summary)
 
         if not self._nonurgent_speak_enabled:
             return
@@ -386,7 +543,7 @@ class CfiRuntime:
                 {
                     "ts": now_epoch,
                     "event": "nonurgent_speech_skipped",
-                    "phase": self._phase_state.phase.value,
+                    "phase": phase_value,
                     "reason": "empty_coach_text",
                 }
             )
@@ -396,7 +553,7 @@ class CfiRuntime:
                 {
                     "ts": now_epoch,
                     "event": "nonurgent_speech_skipped",
-                    "phase": self._phase_state.phase.value,
+                    "phase": phase_value,
                     "reason": "low_value_text",
                     "text": coach_text,
                 }
@@ -409,7 +566,7 @@ class CfiRuntime:
                     "ts": now_epoch,
                     "event": "nonurgent_speech_suppressed",
                     "reason": "recent_urgent",
-                    "phase": self._phase_state.phase.value,
+                    "phase": phase_value,
                 }
             )
             return
@@ -417,7 +574,7 @@ class CfiRuntime:
         spoke = await self._speech.speak_nonurgent(coach_text)
         channel = "nonurgent"
         if not spoke and priority_review:
-            key = f"priority_review_{self._phase_state.phase.value}"
+            key = f"priority_review_{phase_value}"
             spoke = await self._speech.speak_urgent(coach_text, key)
             channel = "priority_review_fallback"
 
@@ -425,7 +582,7 @@ class CfiRuntime:
             {
                 "ts": time.time(),
                 "event": "nonurgent_speech",
-                "phase": self._phase_state.phase.value,
+                "phase": phase_value,
                 "spoken": spoke,
                 "text": coach_text,
                 "channel": channel,
@@ -433,8 +590,8 @@ class CfiRuntime:
             }
         )
         if spoke:
-            print(f"[COACH] {coach_text}")
-            self._telemetry.emit("nonurgent_speech_spoken", 1.0, {"phase": self._phase_state.phase.value})
+            _log.info("[COACH] %s", coach_text)
+            self._telemetry.emit("nonurgent_speech_spoken", 1.0, {"phase": phase_value})
 
     async def _start_with_retry(self, *, label: str, starter: Any) -> None:
         attempt = 0
@@ -444,7 +601,7 @@ class CfiRuntime:
             try:
                 await starter()
                 if attempt > 1:
-                    print(f"[RETRY] {label} connected on attempt {attempt}.")
+                    _log.info("[RETRY] %s connected on attempt %d.", label, attempt)
                 return
             except asyncio.CancelledError:
                 raise
@@ -458,9 +615,11 @@ class CfiRuntime:
                         "error": str(exc),
                     }
                 )
-                print(
-                    f"[RETRY] {label} unavailable: {exc}. "
-                    f"Retrying in {self._config.xplane_retry_sec:.1f}s."
+                _log.warning(
+                    "[RETRY] %s unavailable: %s. Retrying in %.1fs.",
+                    label,
+                    exc,
+                    self._config.xplane_retry_sec,
                 )
                 if max_attempts > 0 and attempt >= max_attempts:
                     raise RuntimeError(
@@ -469,11 +628,11 @@ class CfiRuntime:
                 await asyncio.sleep(self._config.xplane_retry_sec)
 
     async def _bootstrap_session_profile(self) -> None:
-        start = time.time()
+        start = time.monotonic()
         snapshots = self._udp.window(self._config.startup_bootstrap_wait_sec)
         while (
             len(snapshots) < 3
-            and time.time() - start < self._config.startup_bootstrap_wait_sec
+            and time.monotonic() - start < self._config.startup_bootstrap_wait_sec
         ):
             await asyncio.sleep(0.2)
             snapshots = self._udp.window(self._config.startup_bootstrap_wait_sec)
@@ -491,28 +650,27 @@ class CfiRuntime:
                 ),
                 raw_llm_output=str(exc),
             )
-        await self._memory.record_event(
-            "session_profile",
-            asdict(self._session_profile),
-        )
+        profile_payload = asdict(self._session_profile)
+        await self._memory.record_event("session_profile", profile_payload)
         self._runtime_log.write(
             {
                 "ts": time.time(),
                 "event": "session_profile_initialized",
-                "profile": asdict(self._session_profile),
+                "profile": profile_payload,
                 "snapshot_count": len(snapshots),
             }
         )
         self._hazard_monitor.set_hazard_profile(self._session_profile.hazard_profile)
-        print(
-            "[BOOTSTRAP] "
-            f"aircraft={self._session_profile.aircraft_icao} "
-            f"confidence={self._session_profile.confidence:.2f}"
-        )
-        print(
-            "[BOOTSTRAP PROFILE] "
-            + json.dumps(_profile_console_payload(self._session_profile), ensure_ascii=True)
+        _log.info(
+            "[BOOTSTRAP] aircraft=%s confidence=%.2f",
+            self._session_profile.aircraft_icao,
+            self._session_profile.confidence,
         )
+        if _log.isEnabledFor(logging.INFO):
+            _log.info(
+                "[BOOTSTRAP PROFILE] %s",
+                json.dumps(_profile_console_payload(self._session_profile), ensure_ascii=True),
+            )
 
         if self._nonurgent_speak_enabled and self._session_profile.welcome_message.strip():
             spoke = await self._speech.speak_nonurgent(
@@ -527,75 +685,68 @@ class CfiRuntime:
                 }
             )
             if spoke:
-                print(f"[WELCOME] {self._session_profile.welcome_message.strip()}")
+                _log.info("[WELCOME] %s", self._session_profile.welcome_message.strip())
 
-    def _start_hazard_phrase_refresh_loop(self) -> None:
-        if not self._config.hazard_phrase_runtime_enabled:
+    def _start_hazard_phrase_refresh(self) -> None:
+        if not self._config.hazard_phrase_runtime_enabled or self._session_profile is None:
             return
         refresher = getattr(self._team, "refresh_hazard_phrase_variants", None)
         if not callable(refresher):
             return
         if self._hazard_phrase_refresh_task is not None and not self._hazard_phrase_refresh_task.done():
             return
-        self._hazard_phrase_refresh_task = asyncio.create_task(self._hazard_phrase_refresh_loop())
-
-    async def _hazard_phrase_refresh_loop(self) -> None:
-        refresh_sec = max(0.1, self._config.hazard_phrase_refresh_sec)
-        while True:
-            try:
-                await asyncio.sleep(refresh_sec)
-            except asyncio.CancelledError:
-                raise
-
-            if self._session_profile is None:
-                continue
-            refresher = getattr(self._team, "refresh_hazard_phrase_variants", None)
-            if not callable(refresher):
-                continue
+        self._hazard_phrase_refresh_task = asyncio.create_task(self._refresh_hazard_phrases(refresher))
 
-            try:
-                variants = await refresher(
-                    session_profile=self._session_profile,
-                    recent_alert_counts=dict(self._hazard_alert_counts),
-                )
-            except asyncio.CancelledError:
-                raise
-            except Exception as exc:  # noqa: BLE001
-                self._runtime_log.write(
-                    {
-                        "ts": time.time(),
-                        "event": "hazard_phrase_refresh_failed",
-                        "error": str(exc),
-                    }
-                )
-                continue
-
-            if not variants:
-                continue
-
-            self._hazard_monitor.update_speech_variants(variants)
-            self._session_profile = replace(
-                self._session_profile,
-                hazard_profile=replace(
-                    self._session_profile.hazard_profile,
-                    speech_variants=_merge_speech_variants(
-                        self._session_profile.hazard_profile.speech_variants,
-                        variants,
-                    ),
-                ),
+    async def _refresh_hazard_phrases(self, refresher: Any) -> None:
+        if self._session_profile is None:
+            return
+        try:
+            variants = await refresher(
+                session_profile=self._session_profile,
+                recent_alert_counts=dict(self._hazard_alert_counts),
             )
+        except Exception as exc:  # noqa: BLE001
             self._runtime_log.write(
                 {
                     "ts": time.time(),
-                    "event": "hazard_phrase_refresh_applied",
-                    "rule_count": len(variants),
-                    "rules": sorted(variants.keys()),
+                    "event": "hazard_phrase_refresh_failed",
+                    "error": str(exc),
                 }
             )
+            return
+
+        if not variants or self._session_profile is None:
+            return
+        current_variants = self._session_profile.hazard_profile.speech_variants
+        if all(current_variants.get(rule) == lines for rule, lines in variants.items()):
+            # Nothing new; keep the monitor's rotation state and skip the profile rebuild.
+            return
+
+        self._hazard_monitor.update_speech_variants(variants)
+        self._session_profile = replace(
+            self._session_profile,
+            hazard_profile=replace(
+                self._session_profile.hazard_profile,
+                speech_variants=_merge_speech_variants(
+                    self._session_profile.hazard_profile.speech_variants,
+                    variants,
+                ),
+            ),
+        )
+        self._runtime_log.write(
+            {
+                "ts": time.time(),
+                "event": "hazard_phrase_refresh_applied",
+                "rule_count": len(variants),
+                "rules": sorted(variants.keys()),
+            }
+        )
 
     async def _run_shutdown_debrief(self, reason: str) -> None:
         if self._shutdown_debrief_emitted:
             return
+        # A periodic review still holding the team would block the snapshot loop until its LLM call ends.
+        await self._cancel_nonurgent_review()
 
         snapshots = list(self._session_snapshots)
         if not snapshots:
@@ -614,7 +765,8 @@ class CfiRuntime:
 
         review = self._build_shutdown_review(snapshots)
         try:
-            decision = await self._team.run_review(review, session_profile=self._session_profile)
+            async with self._team_lock:
+                decision = await self._team.run_review(review, session_profile=self._session_profile)
         except Exception as exc:  # noqa: BLE001
             self._runtime_log.write(
                 {
@@ -626,6 +778,8 @@ class CfiRuntime:
             )
             return
 
+        review_payload = review.as_dict()
+        decision_payload = decision.as_dict()
         self._runtime_log.write(
             {
                 "ts": time.time(),
@@ -633,8 +787,8 @@ class CfiRuntime:
                 "flight_index": self._flight_index,
                 "reason": reason,
                 "phase": self._phase_state.phase.value,
-                "review_window": asdict(review),
-                "decision": asdict(decision),
+                "review_window": review_payload,
+                "decision": decision_payload,
                 "hazard_events_count": self._hazard_events_count,
             }
         )
@@ -643,14 +797,14 @@ class CfiRuntime:
             {
                 "reason": reason,
                 "phase": self._phase_state.phase.value,
-                "review_window": asdict(review),
-                "decision": asdict(decision),
+                "review_window": review_payload,
+                "decision": decision_payload,
                 "hazard_events_count": self._hazard_events_count,
             },
         )
         self._shutdown_debrief_emitted = True
 
-        print(f"[SHUTDOWN REVIEW] {decision.summary}")
+        _log.info("[SHUTDOWN REVIEW] %s", decision.summary)
 
         shutdown_text = _select_coach_text(decision)
         if self._nonurgent_speak_enabled and shutdown_text:
@@ -709,7 +863,7 @@ class CfiRuntime:
                 "dwell_sec": dwell_sec,
             }
         )
-        print("[SHUTDOWN] Engine shutdown detected, running full-flight debrief.")
+        _log.info("[SHUTDOWN] Engine shutdown detected, running full-flight debrief.")
         await self._run_shutdown_debrief("engine_shutdown_detected")
 
     def _is_shutdown_candidate(self, snapshot: FlightSnapshot) -> bool:
@@ -756,7 +910,7 @@ class CfiRuntime:
                 "reason": "post_shutdown_activity",
             },
         )
-        print(f"[FLIGHT] New flight cycle started: #{self._flight_index}")
+        _log.info("[FLIGHT] New flight cycle started: #%d", self._flight_index)
 
     def _is_new_flight_activity(self, snapshot: FlightSnapshot) -> bool:
         gs_kt = (snapshot.groundspeed_m_s or 0.0) * 1.94384
@@ -797,7 +951,7 @@ class CfiRuntime:
         )
         self._hazard_events_count = 0
         self._hazard_alert_counts = {}
-        self._session_snapshots = []
+        self._session_snapshots.clear()
         self._phase_path = [FlightPhase.PREFLIGHT]
         self._saw_airborne_segment = False
         self._shutdown_candidate_since = None
@@ -857,11 +1011,16 @@ def _downsample_snapshots(snapshots: list[FlightSnapshot], max_samples: int) ->
 
 
 def _is_priority_review(decision: TeamDecision) -> bool:
-    corpus_parts = [decision.summary, decision.speak_text]
-    corpus_parts.extend(decision.feedback_items)
-    corpus = " ".join(part.strip().lower() for part in corpus_parts if part and part.strip())
-    if not corpus:
+    corpus_parts: list[str] = []
+    for part in (decision.summary, decision.speak_text, *decision.feedback_items):
+        if not part:
+            continue
+        stripped = part.strip()
+        if stripped:
+            corpus_parts.append(stripped.lower())
+    if not corpus_parts:
         return False
+    corpus = " ".join(corpus_parts)
     return any(keyword in corpus for keyword in PRIORITY_REVIEW_KEYWORDS)
 
 
@@ -876,10 +1035,14 @@ def _select_coach_text(decision: TeamDecision) -> str:
     return ""
 
 
+@lru_cache(maxsize=512)
 def _normalize_speech_text(text: str, max_chars: int = 160) -> str:
     cleaned = " ".join(text.split()).strip()
-    cleaned = re.sub(r"^[A-Za-z ]{1,32} review:\s*", "", cleaned, flags=re.IGNORECASE)
-    cleaned = re.sub(r"^(however|but|and)\s*[:,\-]?\s*", "", cleaned, flags=re.IGNORECASE)
+    # Both prefixes are anchored, so only enter the regex engine when the head can match.
+    if ":" in cleaned[:41]:
+        cleaned = _REVIEW_PREFIX_RE.sub("", cleaned)
+    if cleaned[:7].lower().startswith(_LEADING_CONJUNCTIONS):
+        cleaned = _LEADING_CONJUNCTION_RE.sub("", cleaned)
     cleaned = _humanize_coach_text(cleaned)
     if not cleaned:
         return ""
@@ -893,22 +1056,14 @@ def _humanize_coach_text(text: str) -> str:
     cleaned = text.strip()
     if not cleaned:
         return ""
-    cleaned = re.sub(r"\([^)]{1,40}\)", "", cleaned)
-    cleaned = re.sub(r"\bthis indicates\b", "That means", cleaned, flags=re.IGNORECASE)
-    cleaned = re.sub(r"\bit indicates\b", "That means", cleaned, flags=re.IGNORECASE)
-    cleaned = re.sub(r"\bwas observed\b", "was noted", cleaned, flags=re.IGNORECASE)
-    cleaned = re.sub(r"\bwere observed\b", "were noted", cleaned, flags=re.IGNORECASE)
-    cleaned = re.sub(r"\bwas detected\b", "was noted", cleaned, flags=re.IGNORECASE)
-    cleaned = re.sub(r"\bwere detected\b", "were noted", cleaned, flags=re.IGNORECASE)
-    cleaned = re.sub(r"\bimmediate coaching is needed on\b", "Let's focus on", cleaned, flags=re.IGNORECASE)
-    cleaned = re.sub(r"\brecommend\b", "Let's", cleaned, flags=re.IGNORECASE)
-    cleaned = re.sub(r"\bemphasize\b", "Focus on", cleaned, flags=re.IGNORECASE)
-    cleaned = re.sub(r"\s+", " ", cleaned).strip(" ,;:-")
+    for pattern, replacement in _HUMANIZE_REWRITES:
+        cleaned = pattern.sub(replacement, cleaned)
+    cleaned = _WHITESPACE_RE.sub(" ", cleaned).strip(" ,;:-")
     if not cleaned:
         return ""
 
     lower = cleaned.lower()
-    if not re.search(r"\b(you|we|let's)\b", lower):
+    if COACH_ADDRESS_TOKENS.isdisjoint(_WORD_TOKEN_RE.findall(lower)):
         if any(token in lower for token in ACTIONABLE_COACH_KEYWORDS):
             cleaned = f"Let's {cleaned[0].lower() + cleaned[1:]}" if len(cleaned) > 1 else cleaned
     return cleaned
@@ -919,9 +1074,7 @@ def _is_low_value_coach_text(text: str) -> bool:
     if not lower:
         return True
     has_low_marker = any(marker in lower for marker in LOW_VALUE_COACH_MARKERS)
-    has_no_detect_pattern = bool(
-        re.search(r"\bno\b.{0,35}\b(detected|observed|noted|issues?)\b", lower)
-    )
+    has_no_detect_pattern = _NO_DETECTION_RE.search(lower) is not None
     has_action = any(keyword in lower for keyword in ACTIONABLE_COACH_KEYWORDS)
     return (has_low_marker or has_no_detect_pattern) and not has_action
 
@@ -952,6 +1105,7 @@ def _merge_speech_variants(
 
 
 def _profile_console_payload(profile: SessionProfile) -> dict[str, Any]:
+    # Read-only view for console output; shares the profile's containers instead of copying.
     variant_counts = {
         rule: len(lines)
         for rule, lines in profile.hazard_profile.speech_variants.items()
@@ -961,7 +1115,7 @@ def _profile_console_payload(profile: SessionProfile) -> dict[str, Any]:
         "aircraft_category": profile.aircraft_category,
         "confidence": round(profile.confidence, 3),
         "assumptions": profile.assumptions[:5],
-        "hazard_enabled_rules": list(profile.hazard_profile.enabled_rules),
-        "hazard_thresholds": dict(profile.hazard_profile.thresholds),
+        "hazard_enabled_rules": profile.hazard_profile.enabled_rules,
+        "hazard_thresholds": profile.hazard_profile.thresholds,
         "hazard_speech_variant_counts": variant_counts,
     }
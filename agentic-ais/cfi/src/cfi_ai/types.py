@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Protocol
+from types import MappingProxyType
+from typing import Any, Mapping, Protocol
+
+METERS_TO_FEET = 3.28084
 
 
 class FlightPhase(str, Enum):
@@ -17,7 +20,7 @@ class FlightPhase(str, Enum):
     TAXI_IN = "taxi_in"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FlightSnapshot:
     timestamp_sec: float
     latitude_deg: float | None = None
@@ -40,15 +43,17 @@ class FlightSnapshot:
     stall_warning: bool = False
 
     def agl_ft(self, field_elevation_m: float | None) -> float | None:
-        if self.elevation_m is None or field_elevation_m is None:
+        elevation_m = self.elevation_m
+        if elevation_m is None or field_elevation_m is None:
             return None
-        return (self.elevation_m - field_elevation_m) * 3.28084
+        return (elevation_m - field_elevation_m) * METERS_TO_FEET
 
     def as_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        # Every field is a scalar, so a shallow read matches asdict() without its recursive copy.
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PhaseState:
     phase: FlightPhase
     confidence: float
@@ -57,7 +62,7 @@ class PhaseState:
     changed_at_epoch: float | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HazardAlert:
     alert_id: str
     severity: str
@@ -66,8 +71,11 @@ class HazardAlert:
     cooldown_sec: float
     triggered_at_epoch: float
 
+    def as_dict(self) -> dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReviewWindow:
     start_epoch: float
     end_epoch: float
@@ -76,8 +84,18 @@ class ReviewWindow:
     metrics: dict[str, float]
     event_hints: list[str] = field(default_factory=list)
 
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "start_epoch": self.start_epoch,
+            "end_epoch": self.end_epoch,
+            "phase": self.phase,
+            "sample_count": self.sample_count,
+            "metrics": dict(self.metrics),
+            "event_hints": list(self.event_hints),
+        }
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TeamDecision:
     phase: FlightPhase
     summary: str
@@ -86,41 +104,54 @@ class TeamDecision:
     speak_text: str
     raw_master_output: str = ""
 
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "phase": self.phase,
+            "summary": self.summary,
+            "feedback_items": list(self.feedback_items),
+            "speak_now": self.speak_now,
+            "speak_text": self.speak_text,
+            "raw_master_output": self.raw_master_output,
+        }
+
 
-@dataclass(frozen=True)
+HAZARD_RULE_IDS: tuple[str, ...] = (
+    "stall_or_low_speed",
+    "excessive_sink_low_alt",
+    "high_bank_low_alt",
+    "pull_up_now",
+    "excessive_taxi_speed",
+    "unstable_approach_fast_or_sink",
+)
+
+DEFAULT_HAZARD_THRESHOLDS: Mapping[str, float] = MappingProxyType(
+    {
+        "low_airspeed_kt": 50.0,
+        "low_airspeed_min_agl_ft": 100.0,
+        "excessive_sink_fpm": -1500.0,
+        "excessive_sink_max_agl_ft": 1000.0,
+        "high_bank_deg": 45.0,
+        "high_bank_max_agl_ft": 1000.0,
+        "pull_up_fpm": -1000.0,
+        "pull_up_max_agl_ft": 300.0,
+        "max_taxi_speed_kt": 30.0,
+        "max_taxi_ias_kt": 35.0,
+        "unstable_approach_max_ias_kt": 95.0,
+        "unstable_approach_min_sink_fpm": -1000.0,
+        "unstable_approach_max_agl_ft": 1000.0,
+        "taxi_takeoff_roll_throttle_ratio": 0.65,
+        "taxi_takeoff_roll_ias_kt": 35.0,
+        "taxi_takeoff_roll_gs_kt": 30.0,
+        "taxi_in_rollout_clear_gs_kt": 25.0,
+        "taxi_in_rollout_clear_ias_kt": 30.0,
+    }
+)
+
+
+@dataclass(frozen=True, slots=True)
 class HazardProfile:
-    enabled_rules: list[str] = field(
-        default_factory=lambda: [
-            "stall_or_low_speed",
-            "excessive_sink_low_alt",
-            "high_bank_low_alt",
-            "pull_up_now",
-            "excessive_taxi_speed",
-            "unstable_approach_fast_or_sink",
-        ]
-    )
-    thresholds: dict[str, float] = field(
-        default_factory=lambda: {
-            "low_airspeed_kt": 50.0,
-            "low_airspeed_min_agl_ft": 100.0,
-            "excessive_sink_fpm": -1500.0,
-            "excessive_sink_max_agl_ft": 1000.0,
-            "high_bank_deg": 45.0,
-            "high_bank_max_agl_ft": 1000.0,
-            "pull_up_fpm": -1000.0,
-            "pull_up_max_agl_ft": 300.0,
-            "max_taxi_speed_kt": 30.0,
-            "max_taxi_ias_kt": 35.0,
-            "unstable_approach_max_ias_kt": 95.0,
-            "unstable_approach_min_sink_fpm": -1000.0,
-            "unstable_approach_max_agl_ft": 1000.0,
-            "taxi_takeoff_roll_throttle_ratio": 0.65,
-            "taxi_takeoff_roll_ias_kt": 35.0,
-            "taxi_takeoff_roll_gs_kt": 30.0,
-            "taxi_in_rollout_clear_gs_kt": 25.0,
-            "taxi_in_rollout_clear_ias_kt": 30.0,
-        }
-    )
+    enabled_rules: list[str] = field(default_factory=lambda: list(HAZARD_RULE_IDS))
+    thresholds: dict[str, float] = field(default_factory=lambda: dict(DEFAULT_HAZARD_THRESHOLDS))
     speech_variants: dict[str, list[str]] = field(
         default_factory=lambda: {
             "stall_or_low_speed": [
@@ -158,7 +189,7 @@ class HazardProfile:
     notes: list[str] = field(default_factory=list)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SessionProfile:
     aircraft_icao: str
     aircraft_category: str
@@ -178,6 +209,8 @@ class UdpStateSource(Protocol):
 
     def window(self, seconds: float) -> list[FlightSnapshot]: ...
 
+    async def wait_for_snapshot(self, timeout: float) -> bool: ...
+
 
 class SpeechSink(Protocol):
     async def start(self) -> None: ...
@@ -15,6 +15,20 @@ RREF_RESPONSE_PREFIX: Final[bytes] = b"RREF,"
 RREF_REQUEST_HEADER: Final[bytes] = b"RREF\x00"
 BEACON_PREFIX: Final[bytes] = b"BECN\x00"
 
+_RREF_ENTRY = struct.Struct("<if")
+_RREF_REQUEST = struct.Struct("<5sii400s")
+# BECN body layout (X-Plane):
+#  byte major, byte minor, int host_id, int version, int role, ushort port, char[] name
+_BEACON_HEADER = struct.Struct("<BBiiiH")
+_RREF_PREFIX_LEN = len(RREF_RESPONSE_PREFIX)
+
+RX_DRAIN_MAX_DATAGRAMS = 32
+RX_SOCKET_RCVBUF_BYTES = 1 << 20
+RX_STALE_SEC = 2.0
+RESUBSCRIBE_CHECK_SEC = 1.0
+# Periodic full resubscribe, so a single dropped subscription recovers even while other datarefs stream.
+RESUBSCRIBE_REFRESH_SEC = 15.0
+
 
 DATAREF_BY_KEY: dict[str, str] = {
     "latitude_deg": "sim/flightmodel/position/latitude",
@@ -46,25 +60,31 @@ KEY_BY_INDEX: dict[int, str] = {
 
 
 def build_rref_request_packet(freq_hz: int, index: int, dataref: str) -> bytes:
+    # "400s" zero-pads, and capping at 399 bytes keeps the dataref NUL-terminated.
     encoded = dataref.encode("ascii", errors="ignore")[:399]
-    payload = encoded + b"\x00"
-    payload = payload.ljust(400, b"\x00")
-    return struct.pack("<5sii400s", RREF_REQUEST_HEADER, freq_hz, index, payload)
+    return _RREF_REQUEST.pack(RREF_REQUEST_HEADER, freq_hz, index, encoded)
+
 
+def build_rref_request_packets(freq_hz: int, subscriptions: list[tuple[int, str]]) -> list[bytes]:
+    # Pack the whole batch into one zeroed buffer, then cut it into independent, immutable frames.
+    size = _RREF_REQUEST.size
+    buf = bytearray(size * len(subscriptions))
+    for slot, (index, dataref) in enumerate(subscriptions):
+        encoded = dataref.encode("ascii", errors="ignore")[:399]
+        _RREF_REQUEST.pack_into(buf, slot * size, RREF_REQUEST_HEADER, freq_hz, index, encoded)
+    view = memoryview(buf)
+    return [view[offset : offset + size].tobytes() for offset in range(0, len(buf), size)]
 
-def parse_rref_datagram(payload: bytes) -> dict[int, float]:
-    if not payload.startswith(RREF_RESPONSE_PREFIX):
+
+def parse_rref_datagram(payload: bytes | bytearray | memoryview) -> dict[int, float]:
+    view = memoryview(payload)
+    if view[:_RREF_PREFIX_LEN] != RREF_RESPONSE_PREFIX:
         return {}
 
-    out: dict[int, float] = {}
-    body = payload[len(RREF_RESPONSE_PREFIX) :]
-    chunk_size = 8
-    entry_count = len(body) // chunk_size
-    for i in range(entry_count):
-        chunk = body[i * chunk_size : (i + 1) * chunk_size]
-        index, value = struct.unpack("<if", chunk)
-        out[index] = float(value)
-    return out
+    body = view[_RREF_PREFIX_LEN:]
+    # iter_unpack needs an exact multiple of the entry size; drop any trailing partial entry.
+    usable = len(body) - len(body) % _RREF_ENTRY.size
+    return dict(_RREF_ENTRY.iter_unpack(body[:usable]))
 
 
 class XPlaneUdpClient(UdpStateSource):
@@ -98,11 +118,16 @@ class XPlaneUdpClient(UdpStateSource):
         self._rx_task: asyncio.Task[None] | None = None
         self._resubscribe_task: asyncio.Task[None] | None = None
         self._running = False
+        self._last_rx_at = 0.0
+        self._last_subscribe_at = 0.0
 
-        self._values: dict[str, float] = {}
+        # Dataref values indexed by RREF index; slot 0 is unused.
+        self._values: list[float | None] = [None] * (len(DATAREF_BY_KEY) + 1)
         self._latest: FlightSnapshot | None = None
         maxlen = int(self._buffer_retention_sec * max(1, self._rref_hz) * 2)
         self._snapshots: deque[FlightSnapshot] = deque(maxlen=maxlen)
+        self._snapshot_event = asyncio.Event()
+        self._subscription_packets: dict[int, list[bytes]] = {}
 
     async def start(self) -> None:
         if self._running:
@@ -114,11 +139,15 @@ class XPlaneUdpClient(UdpStateSource):
 
         sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        # A larger receive buffer absorbs RREF bursts while the event loop is busy; the OS may cap it.
+        with suppress(OSError):
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, RX_SOCKET_RCVBUF_BYTES)
         sock.bind((self._local_host, self._local_port))
         sock.setblocking(False)
 
         self._socket = sock
         self._running = True
+        self._last_rx_at = time.monotonic()
 
         await self._subscribe_all(freq_hz=self._rref_hz)
         self._rx_task = asyncio.create_task(self._receive_loop())
@@ -133,7 +162,7 @@ class XPlaneUdpClient(UdpStateSource):
             if task is None:
                 continue
             task.cancel()
-            with suppress(Exception):
+            with suppress(asyncio.CancelledError, Exception):
                 await task
 
         self._rx_task = None
@@ -151,42 +180,89 @@ class XPlaneUdpClient(UdpStateSource):
         if seconds <= 0:
             return []
         cutoff = time.time() - seconds
-        return [snap for snap in self._snapshots if snap.timestamp_sec >= cutoff]
+        # Snapshots are appended in time order; walk back from the newest and stop at the cutoff.
+        out: list[FlightSnapshot] = []
+        for snap in reversed(self._snapshots):
+            if snap.timestamp_sec < cutoff:
+                break
+            out.append(snap)
+        out.reverse()
+        return out
+
+    async def wait_for_snapshot(self, timeout: float) -> bool:
+        if not self._snapshot_event.is_set():
+            try:
+                await asyncio.wait_for(self._snapshot_event.wait(), timeout=max(0.0, timeout))
+            except TimeoutError:
+                return False
+        self._snapshot_event.clear()
+        return True
 
     async def _receive_loop(self) -> None:
         if self._socket is None:
             return
         loop = asyncio.get_running_loop()
+        sock = self._socket
 
         while self._running and self._socket is not None:
-            payload, _addr = await loop.sock_recvfrom(self._socket, 4096)
-            values_by_index = parse_rref_datagram(payload)
-            if not values_by_index:
+            payload, _addr = await loop.sock_recvfrom(sock, 4096)
+            updated = self._apply_datagram(payload)
+            # Drain datagrams already queued so a burst costs one wakeup and one snapshot.
+            for _ in range(RX_DRAIN_MAX_DATAGRAMS):
+                try:
+                    payload, _addr = sock.recvfrom(4096)
+                except (BlockingIOError, InterruptedError):
+                    break
+                updated = self._apply_datagram(payload) or updated
+            if not updated:
                 continue
 
-            for idx, value in values_by_index.items():
-                key = KEY_BY_INDEX.get(idx)
-                if key is None:
-                    continue
-                self._values[key] = value
-
+            self._last_rx_at = time.monotonic()
             snapshot = self._build_snapshot(time.time())
             self._latest = snapshot
             self._snapshots.append(snapshot)
+            self._snapshot_event.set()
+
+    def _apply_datagram(self, payload: bytes) -> bool:
+        values_by_index = parse_rref_datagram(payload)
+        if not values_by_index:
+            return False
+        values = self._values
+        size = len(values)
+        for idx, value in values_by_index.items():
+            if 0 < idx < size:
+                values[idx] = value
+        return True
 
     async def _resubscribe_loop(self) -> None:
+        # Resubscribe promptly when the stream goes quiet (X-Plane restart, aircraft reload) and slowly otherwise.
         while self._running:
-            await asyncio.sleep(5.0)
+            await asyncio.sleep(RESUBSCRIBE_CHECK_SEC)
+            now = time.monotonic()
+            since_subscribe = now - self._last_subscribe_at
+            stale = now - self._last_rx_at >= RX_STALE_SEC and since_subscribe >= RX_STALE_SEC
+            if not stale and since_subscribe < RESUBSCRIBE_REFRESH_SEC:
+                continue
             await self._subscribe_all(freq_hz=self._rref_hz)
 
     async def _subscribe_all(self, *, freq_hz: int) -> None:
         if self._socket is None or self._xplane_addr is None:
             return
-        loop = asyncio.get_running_loop()
-        for key, dataref in DATAREF_BY_KEY.items():
-            idx = INDEX_BY_KEY[key]
-            packet = build_rref_request_packet(freq_hz=freq_hz, index=idx, dataref=dataref)
-            await loop.sock_sendto(self._socket, packet, self._xplane_addr)
+        self._last_subscribe_at = time.monotonic()
+        packets = self._subscription_packets.get(freq_hz)
+        if packets is None:
+            packets = build_rref_request_packets(
+                freq_hz, [(INDEX_BY_KEY[key], dataref) for key, dataref in DATAREF_BY_KEY.items()]
+            )
+            self._subscription_packets[freq_hz] = packets
+        sock = self._socket
+        addr = self._xplane_addr
+        for packet in packets:
+            # The socket is non-blocking and the frames are small; only go through the loop if the buffer is full.
+            try:
+                sock.sendto(packet, addr)
+            except (BlockingIOError, InterruptedError):
+                await asyncio.get_running_loop().sock_sendto(sock, packet, addr)
 
     async def _resolve_xplane_addr(self) -> tuple[str, int]:
         if self._should_attempt_beacon_discovery():
@@ -216,58 +292,59 @@ class XPlaneUdpClient(UdpStateSource):
         return False
 
     def _build_snapshot(self, timestamp_sec: float) -> FlightSnapshot:
-        def _f(name: str) -> float | None:
-            if name not in self._values:
-                return None
-            return float(self._values[name])
-
-        def _i(name: str) -> int | None:
-            value = _f(name)
-            if value is None:
-                return None
-            return int(round(value))
-
-        on_ground = (_f("on_ground") or 0.0) >= 0.5
-        stall_warning = (_f("stall_warning") or 0.0) >= 0.5
-        engine_running_raw = _f("engine_running")
-        engine_running: bool | None = None
-        if engine_running_raw is not None:
-            engine_running = engine_running_raw >= 0.5
+        # Unpacks in DATAREF_BY_KEY order; adding a dataref without updating this raises immediately.
+        (
+            _,
+            latitude_deg,
+            longitude_deg,
+            elevation_m,
+            groundspeed_m_s,
+            indicated_airspeed_kt,
+            heading_true_deg,
+            magnetic_heading_deg,
+            vertical_speed_fpm,
+            roll_deg,
+            pitch_deg,
+            throttle_ratio,
+            engine_running_raw,
+            engine_rpm,
+            flap_ratio,
+            parking_brake_ratio,
+            on_ground_raw,
+            stall_warning_raw,
+            com1_raw,
+        ) = self._values
 
         return FlightSnapshot(
             timestamp_sec=timestamp_sec,
-            latitude_deg=_f("latitude_deg"),
-            longitude_deg=_f("longitude_deg"),
-            elevation_m=_f("elevation_m"),
-            groundspeed_m_s=_f("groundspeed_m_s"),
-            indicated_airspeed_kt=_f("indicated_airspeed_kt"),
-            heading_true_deg=_f("heading_true_deg"),
-            magnetic_heading_deg=_f("magnetic_heading_deg"),
-            vertical_speed_fpm=_f("vertical_speed_fpm"),
-            roll_deg=_f("roll_deg"),
-            pitch_deg=_f("pitch_deg"),
-            throttle_ratio=_f("throttle_ratio"),
-            engine_running=engine_running,
-            engine_rpm=_f("engine_rpm"),
-            flap_ratio=_f("flap_ratio"),
-            parking_brake_ratio=_f("parking_brake_ratio"),
-            com1_hz=_i("com1_hz"),
-            on_ground=on_ground,
-            stall_warning=stall_warning,
+            latitude_deg=latitude_deg,
+            longitude_deg=longitude_deg,
+            elevation_m=elevation_m,
+            groundspeed_m_s=groundspeed_m_s,
+            indicated_airspeed_kt=indicated_airspeed_kt,
+            heading_true_deg=heading_true_deg,
+            magnetic_heading_deg=magnetic_heading_deg,
+            vertical_speed_fpm=vertical_speed_fpm,
+            roll_deg=roll_deg,
+            pitch_deg=pitch_deg,
+            throttle_ratio=throttle_ratio,
+            engine_running=None if engine_running_raw is None else engine_running_raw >= 0.5,
+            engine_rpm=engine_rpm,
+            flap_ratio=flap_ratio,
+            parking_brake_ratio=parking_brake_ratio,
+            com1_hz=None if com1_raw is None else int(round(com1_raw)),
+            on_ground=on_ground_raw is not None and on_ground_raw >= 0.5,
+            stall_warning=stall_warning_raw is not None and stall_warning_raw >= 0.5,
         )
 
 
 def parse_beacon_datagram(payload: bytes, sender_ip: str) -> tuple[str, int] | None:
     if not payload.startswith(BEACON_PREFIX):
         return None
-
-    body = payload[len(BEACON_PREFIX) :]
-    if len(body) < 16:
+    if len(payload) < len(BEACON_PREFIX) + _BEACON_HEADER.size:
         return None
 
-    # BECN body layout (X-Plane):
-    #  byte major, byte minor, int host_id, int version, int role, ushort port, char[] name
-    port = struct.unpack_from("<H", body, 14)[0]
+    _major, _minor, _host_id, _version, _role, port = _BEACON_HEADER.unpack_from(payload, len(BEACON_PREFIX))
     if port <= 0:
         return None
     host = sender_ip.strip()
@@ -11,7 +11,7 @@ from cfi_ai.agent_team import CfiAgentTeam
 from cfi_ai.types import FlightPhase
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class _Msg:
     source: str
     content: str
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import sys
 import unittest
+from functools import cache
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
@@ -9,7 +10,17 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 from cfi_ai.hazard_monitor import HazardMonitor
 from cfi_ai.types import FlightPhase, FlightSnapshot, HazardProfile, PhaseState
 
+# Taxi-speed limits with the takeoff-roll exemption effectively disabled.
+_TAXI_ONLY_THRESHOLDS = {
+    "max_taxi_speed_kt": 20.0,
+    "max_taxi_ias_kt": 25.0,
+    "taxi_takeoff_roll_throttle_ratio": 0.95,
+    "taxi_takeoff_roll_ias_kt": 999.0,
+    "taxi_takeoff_roll_gs_kt": 999.0,
+}
 
+
+@cache
 def _phase(phase: FlightPhase = FlightPhase.APPROACH) -> PhaseState:
     return PhaseState(
         phase=phase,
@@ -21,8 +32,11 @@ def _phase(phase: FlightPhase = FlightPhase.APPROACH) -> PhaseState:
 
 
 class TestHazardMonitor(unittest.TestCase):
+    def setUp(self) -> None:
+        self.monitor = HazardMonitor(urgent_cooldown_sec=8.0)
+
     def test_low_speed_alert(self) -> None:
-        monitor = HazardMonitor(urgent_cooldown_sec=8.0)
+        monitor = self.monitor
         snapshot = FlightSnapshot(
             timestamp_sec=10.0,
             on_ground=False,
@@ -30,11 +44,10 @@ class TestHazardMonitor(unittest.TestCase):
             vertical_speed_fpm=-200.0,
         )
         alerts = monitor.evaluate(snapshot, _phase())
-        alert_ids = {a.alert_id for a in alerts}
-        self.assertIn("stall_or_low_speed", alert_ids)
+        self.assertIn("stall_or_low_speed", [a.alert_id for a in alerts])
 
     def test_high_bank_low_alt_alert(self) -> None:
-        monitor = HazardMonitor(urgent_cooldown_sec=8.0)
+        monitor = self.monitor
         monitor.evaluate(
             FlightSnapshot(
                 timestamp_sec=1.0,
@@ -55,11 +68,10 @@ class TestHazardMonitor(unittest.TestCase):
             roll_deg=52.0,
         )
         alerts = monitor.evaluate(snapshot, _phase())
-        alert_ids = {a.alert_id for a in alerts}
-        self.assertIn("high_bank_low_alt", alert_ids)
+        self.assertIn("high_bank_low_alt", [a.alert_id for a in alerts])
 
     def test_no_alert_on_ground(self) -> None:
-        monitor = HazardMonitor(urgent_cooldown_sec=8.0)
+        monitor = self.monitor
         snapshot = FlightSnapshot(
             timestamp_sec=10.0,
             on_ground=True,
@@ -70,7 +82,7 @@ class TestHazardMonitor(unittest.TestCase):
         self.assertEqual(alerts, [])
 
     def test_excessive_taxi_speed_alert(self) -> None:
-        monitor = HazardMonitor(urgent_cooldown_sec=8.0)
+        monitor = self.monitor
         snapshot = FlightSnapshot(
             timestamp_sec=20.0,
             on_ground=True,
@@ -78,8 +90,7 @@ class TestHazardMonitor(unittest.TestCase):
             indicated_airspeed_kt=41.0,
         )
         alerts = monitor.evaluate(snapshot, _phase(FlightPhase.TAXI_OUT))
-        alert_ids = {a.alert_id for a in alerts}
-        self.assertIn("excessive_taxi_speed", alert_ids)
+        self.assertIn("excessive_taxi_speed", [a.alert_id for a in alerts])
 
     def test_plane_specific_threshold_profile(self) -> None:
         profile = HazardProfile(
@@ -99,11 +110,10 @@ class TestHazardMonitor(unittest.TestCase):
             vertical_speed_fpm=0.0,
         )
         alerts = monitor.evaluate(snapshot, _phase())
-        alert_ids = {a.alert_id for a in alerts}
-        self.assertIn("stall_or_low_speed", alert_ids)
+        self.assertIn("stall_or_low_speed", [a.alert_id for a in alerts])
 
     def test_taxi_speed_suppressed_during_takeoff_roll_transition(self) -> None:
-        monitor = HazardMonitor(urgent_cooldown_sec=8.0)
+        monitor = self.monitor
         snapshot = FlightSnapshot(
             timestamp_sec=30.0,
             on_ground=True,
@@ -112,56 +122,37 @@ class TestHazardMonitor(unittest.TestCase):
             throttle_ratio=0.9,
         )
         alerts = monitor.evaluate(snapshot, _phase(FlightPhase.TAXI_OUT))
-        alert_ids = {a.alert_id for a in alerts}
-        self.assertNotIn("excessive_taxi_speed", alert_ids)
+        self.assertNotIn("excessive_taxi_speed", [a.alert_id for a in alerts])
 
     def test_taxi_speed_suppressed_until_rollout_clears(self) -> None:
-        monitor = HazardMonitor(urgent_cooldown_sec=8.0)
-
-        # High-speed rollout right after touchdown: should be ignored.
-        rollout_fast = FlightSnapshot(
-            timestamp_sec=40.0,
-            on_ground=True,
-            groundspeed_m_s=24.0,  # ~46 kt
-            indicated_airspeed_kt=48.0,
-            throttle_ratio=0.1,
+        monitor = self.monitor
+        steps = (
+            # (ts, groundspeed m/s, ias kt, throttle, expect alert)
+            (40.0, 24.0, 48.0, 0.1, False),  # ~46 kt rollout right after touchdown: ignored.
+            (41.0, 6.0, 14.0, 0.05, False),  # ~12 kt: slow enough to arm taxi monitoring.
+            (42.0, 18.0, 37.0, 0.35, True),  # ~35 kt after arming: fast taxi alerts.
         )
-        alerts = monitor.evaluate(rollout_fast, _phase(FlightPhase.TAXI_IN))
-        self.assertEqual(alerts, [])
-
-        # Slow enough to arm taxi monitoring.
-        rollout_slow = FlightSnapshot(
-            timestamp_sec=41.0,
-            on_ground=True,
-            groundspeed_m_s=6.0,  # ~12 kt
-            indicated_airspeed_kt=14.0,
-            throttle_ratio=0.05,
-        )
-        alerts = monitor.evaluate(rollout_slow, _phase(FlightPhase.TAXI_IN))
-        self.assertEqual(alerts, [])
-
-        # After arming, fast taxi should alert.
-        taxi_fast = FlightSnapshot(
-            timestamp_sec=42.0,
-            on_ground=True,
-            groundspeed_m_s=18.0,  # ~35 kt
-            indicated_airspeed_kt=37.0,
-            throttle_ratio=0.35,
-        )
-        alerts = monitor.evaluate(taxi_fast, _phase(FlightPhase.TAXI_IN))
-        alert_ids = {a.alert_id for a in alerts}
-        self.assertIn("excessive_taxi_speed", alert_ids)
+        for ts, gs_m_s, ias, throttle, expect_alert in steps:
+            with self.subTest(ts=ts):
+                alerts = monitor.evaluate(
+                    FlightSnapshot(
+                        timestamp_sec=ts,
+                        on_ground=True,
+                        groundspeed_m_s=gs_m_s,
+                        indicated_airspeed_kt=ias,
+                        throttle_ratio=throttle,
+                    ),
+                    _phase(FlightPhase.TAXI_IN),
+                )
+                if expect_alert:
+                    self.assertIn("excessive_taxi_speed", [a.alert_id for a in alerts])
+                else:
+                    self.assertEqual(alerts, [])
 
     def test_speech_variants_rotate(self) -> None:
         profile = HazardProfile(
             enabled_rules=["excessive_taxi_speed"],
-            thresholds={
-                "max_taxi_speed_kt": 20.0,
-                "max_taxi_ias_kt": 25.0,
-                "taxi_takeoff_roll_throttle_ratio": 0.95,
-                "taxi_takeoff_roll_ias_kt": 999.0,
-                "taxi_takeoff_roll_gs_kt": 999.0,
-            },
+            thresholds=dict(_TAXI_ONLY_THRESHOLDS),
             speech_variants={
                 "excessive_taxi_speed": [
                     "Taxi pace high. Slow down now.",
@@ -193,6 +184,25 @@ class TestHazardMonitor(unittest.TestCase):
         self.assertEqual(len(second), 1)
         self.assertNotEqual(first[0].speak_text, second[0].speak_text)
 
+    def test_updated_speech_variants_are_normalized(self) -> None:
+        profile = HazardProfile(
+            enabled_rules=["excessive_taxi_speed"],
+            thresholds=dict(_TAXI_ONLY_THRESHOLDS),
+        )
+        monitor = HazardMonitor(urgent_cooldown_sec=8.0, hazard_profile=profile)
+        monitor.update_speech_variants({"excessive_taxi_speed": ["  Easy   on the   taxi speed  ", "   "]})
+        alerts = monitor.evaluate(
+            FlightSnapshot(
+                timestamp_sec=50.0,
+                on_ground=True,
+                groundspeed_m_s=16.0,
+                indicated_airspeed_kt=30.0,
+                throttle_ratio=0.2,
+            ),
+            _phase(FlightPhase.TAXI_OUT),
+        )
+        self.assertEqual([a.speak_text for a in alerts], ["Easy on the taxi speed."])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import json
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from cfi_ai import json_codec
+
+_PAYLOAD = {
+    "event": "hazard_alert",
+    "text": "Vérifiez la vitesse",
+    "values": [float("nan"), float("inf"), -float("inf"), 1.5],
+    "nested": {"ias": float("nan"), 3: "int key"},
+}
+_EXPECTED = {
+    "event": "hazard_alert",
+    "text": "Vérifiez la vitesse",
+    "values": [None, None, None, 1.5],
+    "nested": {"ias": None, "3": "int key"},
+}
+
+
+def _strict_loads(text: str):
+    def reject(token: str):
+        raise ValueError(f"non-standard JSON token {token}")
+
+    return json.loads(text, parse_constant=reject)
+
+
+class TestJsonCodecDumps(unittest.TestCase):
+    def test_stdlib_fallback(self) -> None:
+        with mock.patch.object(json_codec, "orjson", None):
+            out = json_codec.dumps(_PAYLOAD)
+        self.assertIn("Vérifiez", out)
+        self.assertEqual(_strict_loads(out), _EXPECTED)
+
+    @unittest.skipIf(json_codec.orjson is None, "orjson not installed")
+    def test_orjson_matches_fallback(self) -> None:
+        with mock.patch.object(json_codec, "orjson", None):
+            fallback = json_codec.dumps(_PAYLOAD)
+        self.assertEqual(json_codec.dumps(_PAYLOAD), fallback)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from cfi_ai.runtime import JsonlLogger
+
+
+def _read_events(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+
+
+class TestJsonlLogger(unittest.TestCase):
+    def test_write_is_buffered_until_flush(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "logs" / "events.jsonl"
+            logger = JsonlLogger(str(path))
+
+            logger.write({"event": "a", "value": 1})
+            logger.write({"event": "b", "value": 2})
+            self.assertFalse(path.exists())
+
+            logger.flush()
+            self.assertEqual(_read_events(path), [{"event": "a", "value": 1}, {"event": "b", "value": 2}])
+            logger.close()
+
+    def test_max_pending_triggers_flush(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "events.jsonl"
+            logger = JsonlLogger(str(path), max_pending=3)
+
+            logger.write({"event": "a"})
+            logger.write({"event": "b"})
+            self.assertFalse(path.exists())
+
+            logger.write({"event": "c"})
+            self.assertEqual([evt["event"] for evt in _read_events(path)], ["a", "b", "c"])
+            logger.close()
+
+    def test_close_is_idempotent(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "events.jsonl"
+            logger = JsonlLogger(str(path))
+
+            logger.write({"event": "a"})
+            logger.close()
+            logger.close()
+            self.assertEqual(_read_events(path), [{"event": "a"}])
+
+    def test_write_after_close_reopens_file(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "events.jsonl"
+            logger = JsonlLogger(str(path))
+
+            logger.write({"event": "a"})
+            logger.close()
+            logger.write({"event": "b"})
+            logger.close()
+            self.assertEqual([evt["event"] for evt in _read_events(path)], ["a", "b"])
+
+
+if __name__ == "__main__":
+    unittest.main()
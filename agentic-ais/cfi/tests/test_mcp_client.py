@@ -1,12 +1,13 @@
 from __future__ import annotations
 
+import math
 import sys
 import unittest
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
-from cfi_ai.mcp_client import _normalize_tts_message
+from cfi_ai.mcp_client import _decode_tool_result, _normalize_tts_message
 
 
 class TestMcpClientTtsNormalization(unittest.TestCase):
@@ -22,6 +23,28 @@ class TestMcpClientTtsNormalization(unittest.TestCase):
         out = _normalize_tts_message(text)
         self.assertIn("70 knots", out)
 
+    def test_bare_units_and_case_converted(self) -> None:
+        out = _normalize_tts_message("  Hold  100 KT,   check kt and agl   ")
+        self.assertEqual(out, "Hold 100 knots, check knots and above ground level")
+
+    def test_unit_prefix_words_untouched(self) -> None:
+        self.assertEqual(_normalize_tts_message("kts fpm agly"), "kts fpm agly")
+
+
+class TestMcpClientToolResultDecode(unittest.TestCase):
+    def test_nan_value_decodes_to_dict(self) -> None:
+        out = _decode_tool_result({"content": [{"text": '{"name": "sim/test", "value": NaN}'}]})
+        self.assertEqual(out["name"], "sim/test")
+        self.assertTrue(math.isnan(out["value"]))
+
+    def test_wide_integer_kept_exact(self) -> None:
+        out = _decode_tool_result({"content": [{"text": '{"value": 123456789012345678901234567890}'}]})
+        self.assertEqual(out["value"], 123456789012345678901234567890)
+
+    def test_structured_content_skips_text_parse(self) -> None:
+        out = _decode_tool_result({"structuredContent": {"value": 1.5}, "content": [{"text": "not json"}]})
+        self.assertEqual(out, {"value": 1.5})
+
 
 if __name__ == "__main__":
     unittest.main()
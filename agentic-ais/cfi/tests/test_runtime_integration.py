@@ -2,17 +2,22 @@ from __future__ import annotations
 
 import asyncio
 import json
+import socket
+import struct
 import tempfile
 import time
 import sys
 import unittest
+from dataclasses import replace
 from pathlib import Path
+from unittest import mock
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
 from cfi_ai.config import CfiConfig
 from cfi_ai.runtime import CfiRuntime
 from cfi_ai.types import FlightPhase, FlightSnapshot, SessionProfile, TeamDecision
+from cfi_ai.xplane_udp import INDEX_BY_KEY
 
 
 class _FakeUdp:
@@ -32,10 +37,31 @@ class _FakeUdp:
         del seconds
         return list(self._snapshots)
 
+    async def wait_for_snapshot(self, timeout: float) -> bool:
+        await asyncio.sleep(timeout)
+        return False
+
+
+class _StallingUdp(_FakeUdp):
+    def __init__(self, snapshots: list[FlightSnapshot], stall_sec: float) -> None:
+        super().__init__(snapshots)
+        self._stall_sec = stall_sec
+
+    async def wait_for_snapshot(self, timeout: float) -> bool:
+        if self._stall_sec > 0:
+            # Simulate synchronous work hogging the event loop once.
+            time.sleep(self._stall_sec)
+            self._stall_sec = 0.0
+            return False
+        return await super().wait_for_snapshot(timeout)
+
 
 class _StreamingUdp:
-    def __init__(self, snapshots: list[FlightSnapshot]) -> None:
+    """Releases one more snapshot per wait_for_snapshot() wake, so the runtime sees every snapshot once."""
+
+    def __init__(self, snapshots: list[FlightSnapshot], tick_sec: float = 0.05) -> None:
         self._snapshots = snapshots
+        self._tick_sec = tick_sec
         self._idx = -1
 
     async def start(self) -> None:
@@ -44,25 +70,26 @@ class _StreamingUdp:
     async def stop(self) -> None:
         return
 
-    def latest(self) -> FlightSnapshot | None:
+    async def wait_for_snapshot(self, timeout: float) -> bool:
+        await asyncio.sleep(max(0.0, min(timeout, self._tick_sec)))
         if self._idx + 1 < len(self._snapshots):
             self._idx += 1
-        if self._idx < 0:
-            return None
-        return self._snapshots[self._idx]
+            return True
+        return False
+
+    def latest(self) -> FlightSnapshot | None:
+        return self._snapshots[self._idx] if self._idx >= 0 else None
 
     def window(self, seconds: float) -> list[FlightSnapshot]:
         del seconds
-        if self._idx < 0:
-            return []
-        return list(self._snapshots[: self._idx + 1])
+        return self._snapshots[: self._idx + 1]
 
 
 class _FakeSpeech:
     def __init__(self) -> None:
         self.urgent_calls: list[tuple[str, str]] = []
         self.nonurgent_calls: list[str] = []
-        self._last_urgent_at = 0.0
+        self._last_urgent_at = float("-inf")
 
     async def start(self) -> None:
         return
@@ -72,7 +99,7 @@ class _FakeSpeech:
 
     async def speak_urgent(self, text: str, key: str) -> bool:
         self.urgent_calls.append((key, text))
-        self._last_urgent_at = time.time()
+        self._last_urgent_at = time.monotonic()
         return True
 
     async def speak_nonurgent(self, text: str) -> bool:
@@ -80,7 +107,18 @@ class _FakeSpeech:
         return True
 
     def recent_urgent(self, within_sec: float) -> bool:
-        return (time.time() - self._last_urgent_at) <= within_sec
+        return (time.monotonic() - self._last_urgent_at) <= max(0.0, within_sec)
+
+
+class _SlowUrgentSpeech(_FakeSpeech):
+    def __init__(self, delay_sec: float) -> None:
+        super().__init__()
+        self._delay_sec = delay_sec
+
+    async def speak_urgent(self, text: str, key: str) -> bool:
+        # Awaiting yields to the event loop, so this delays the runtime loop without blocking it.
+        await asyncio.sleep(self._delay_sec)
+        return await super().speak_urgent(text, key)
 
 
 class _FlakySpeech(_FakeSpeech):
@@ -167,6 +205,28 @@ class _RefreshingTeam(_FakeTeam):
         }
 
 
+class _FlightResetDuringReviewTeam(_FakeTeam):
+    """Moves the runtime to a new phase and flight while the review is in flight."""
+
+    def __init__(self) -> None:
+        super().__init__(speak_now=False)
+        self.runtime: CfiRuntime | None = None
+
+    async def run_review(self, review, session_profile: SessionProfile | None = None) -> TeamDecision:
+        assert self.runtime is not None
+        self.runtime._phase_state = replace(self.runtime._phase_state, phase=FlightPhase.CRUISE)
+        self.runtime._flight_index += 1
+        return await super().run_review(review, session_profile=session_profile)
+
+
+class _SlowFirstReviewTeam(_FakeTeam):
+    async def run_review(self, review, session_profile: SessionProfile | None = None) -> TeamDecision:
+        if self.calls == 0:
+            self.calls += 1
+            await asyncio.sleep(5.0)
+        return await super().run_review(review, session_profile=session_profile)
+
+
 class _LowValueSpeakTeam(_FakeTeam):
     async def run_review(self, review, session_profile: SessionProfile | None = None) -> TeamDecision:
         del session_profile
@@ -195,6 +255,29 @@ class _RobotToneTeam(_FakeTeam):
         )
 
 
+async def _wait_until(predicate, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() >= deadline:
+            raise AssertionError("condition not met before timeout")
+        await asyncio.sleep(0.005)
+
+
+async def _run_until(runtime: CfiRuntime, predicate, timeout: float = 2.0) -> None:
+    # Run until the condition holds (or run() exits on its own), then stop instead of sleeping a fixed budget.
+    run_task = asyncio.create_task(runtime.run())
+    try:
+        await _wait_until(lambda: run_task.done() or predicate(), timeout)
+    finally:
+        runtime.request_stop()
+        await asyncio.wait_for(run_task, timeout=2.0)
+
+
+def _review_settled(runtime: CfiRuntime, team: _FakeTeam) -> bool:
+    task = runtime._review_task
+    return team.calls >= 1 and task is not None and task.done()
+
+
 def _config(tmpdir: str) -> CfiConfig:
     return CfiConfig(
         xplane_udp_host="127.0.0.1",
@@ -205,7 +288,7 @@ def _config(tmpdir: str) -> CfiConfig:
         xplane_beacon_timeout_sec=1.0,
         xplane_udp_local_port=49001,
         xplane_rref_hz=10,
-        xplane_retry_sec=0.1,
+        xplane_retry_sec=0.001,
         xplane_start_max_retries=3,
         startup_bootstrap_wait_sec=0.1,
         xplane_mcp_sse_url="http://127.0.0.1:8765/sse",
@@ -221,11 +304,11 @@ def _config(tmpdir: str) -> CfiConfig:
         autogen_base_url="https://models.github.ai/inference",
         autogen_api_key="",
         review_window_sec=0.5,
-        review_tick_sec=0.1,
+        review_tick_sec=0.05,
         urgent_cooldown_sec=8.0,
         nonurgent_cooldown_sec=0.1,
         nonurgent_suppress_after_urgent_sec=5.0,
-        shutdown_detect_dwell_sec=0.2,
+        shutdown_detect_dwell_sec=0.02,
         hazard_phrase_refresh_sec=30.0,
         hazard_phrase_runtime_enabled=True,
         memory_backend="none",
@@ -237,469 +320,632 @@ def _config(tmpdir: str) -> CfiConfig:
 
 
 class TestRuntimeIntegration(unittest.IsolatedAsyncioTestCase):
-    async def test_urgent_suppresses_nonurgent(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cfg = _config(tmpdir)
-            snapshot = FlightSnapshot(
-                timestamp_sec=time.time(),
-                on_ground=False,
-                indicated_airspeed_kt=45.0,
-                vertical_speed_fpm=-200.0,
-            )
-            udp = _FakeUdp([snapshot])
-            speech = _FakeSpeech()
-            team = _FakeTeam(speak_now=True)
+    async def asyncSetUp(self) -> None:
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.cfg = _config(tmpdir.name)
 
-            runtime = CfiRuntime(
-                cfg,
-                udp_source=udp,
-                speech_sink=speech,
-                team_runner=team,
-            )
-            await runtime.run(duration_sec=0.25)
+    async def test_urgent_suppresses_nonurgent(self) -> None:
+        cfg = self.cfg
+        snapshot = FlightSnapshot(
+            timestamp_sec=time.time(),
+            on_ground=False,
+            indicated_airspeed_kt=45.0,
+            vertical_speed_fpm=-200.0,
+        )
+        udp = _FakeUdp([snapshot])
+        speech = _FakeSpeech()
+        team = _FakeTeam(speak_now=True)
+
+        runtime = CfiRuntime(
+            cfg,
+            udp_source=udp,
+            speech_sink=speech,
+            team_runner=team,
+        )
+        await _run_until(runtime, lambda: _review_settled(runtime, team))
 
-            self.assertGreaterEqual(len(speech.urgent_calls), 1)
-            self.assertNotIn("Keep refining your profile.", speech.nonurgent_calls)
-            self.assertGreaterEqual(team.calls, 1)
+        self.assertGreaterEqual(len(speech.urgent_calls), 1)
+        self.assertNotIn("Keep refining your profile.", speech.nonurgent_calls)
+        self.assertGreaterEqual(team.calls, 1)
 
     async def test_nonurgent_spoken_without_recent_urgent(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cfg = _config(tmpdir)
-            snapshot = FlightSnapshot(
-                timestamp_sec=time.time(),
-                on_ground=True,
-                elevation_m=100.0,
-                groundspeed_m_s=0.0,
-                indicated_airspeed_kt=0.0,
-                vertical_speed_fpm=0.0,
-            )
-            udp = _FakeUdp([snapshot])
-            speech = _FakeSpeech()
-            team = _FakeTeam(speak_now=True)
-
-            runtime = CfiRuntime(
-                cfg,
-                udp_source=udp,
-                speech_sink=speech,
-                team_runner=team,
-            )
-            await runtime.run(duration_sec=0.25)
+        cfg = self.cfg
+        snapshot = FlightSnapshot(
+            timestamp_sec=time.time(),
+            on_ground=True,
+            elevation_m=100.0,
+            groundspeed_m_s=0.0,
+            indicated_airspeed_kt=0.0,
+            vertical_speed_fpm=0.0,
+        )
+        udp = _FakeUdp([snapshot])
+        speech = _FakeSpeech()
+        team = _FakeTeam(speak_now=True)
+
+        runtime = CfiRuntime(
+            cfg,
+            udp_source=udp,
+            speech_sink=speech,
+            team_runner=team,
+        )
+        await _run_until(runtime, lambda: _review_settled(runtime, team))
 
-            self.assertEqual(len(speech.urgent_calls), 0)
-            self.assertGreaterEqual(len(speech.nonurgent_calls), 1)
-            self.assertGreaterEqual(team.calls, 1)
+        self.assertEqual(len(speech.urgent_calls), 0)
+        self.assertGreaterEqual(len(speech.nonurgent_calls), 1)
+        self.assertGreaterEqual(team.calls, 1)
 
     async def test_priority_review_spoken_even_when_speak_now_false(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cfg = _config(tmpdir)
-            snapshot = FlightSnapshot(
-                timestamp_sec=time.time(),
-                on_ground=True,
-                elevation_m=100.0,
-                groundspeed_m_s=0.0,
-                indicated_airspeed_kt=0.0,
-                vertical_speed_fpm=0.0,
-            )
-            udp = _FakeUdp([snapshot])
-            speech = _FakeSpeech()
-            team = _PriorityReviewTeam(speak_now=False)
-
-            runtime = CfiRuntime(
-                cfg,
-                udp_source=udp,
-                speech_sink=speech,
-                team_runner=team,
-            )
-            await runtime.run(duration_sec=0.25)
+        cfg = self.cfg
+        snapshot = FlightSnapshot(
+            timestamp_sec=time.time(),
+            on_ground=True,
+            elevation_m=100.0,
+            groundspeed_m_s=0.0,
+            indicated_airspeed_kt=0.0,
+            vertical_speed_fpm=0.0,
+        )
+        udp = _FakeUdp([snapshot])
+        speech = _FakeSpeech()
+        team = _PriorityReviewTeam(speak_now=False)
+
+        runtime = CfiRuntime(
+            cfg,
+            udp_source=udp,
+            speech_sink=speech,
+            team_runner=team,
+        )
+        await _run_until(runtime, lambda: _review_settled(runtime, team))
 
-            self.assertGreaterEqual(len(speech.nonurgent_calls), 1)
+        self.assertGreaterEqual(len(speech.nonurgent_calls), 1)
 
     async def test_low_value_no_evidence_text_not_spoken(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cfg = _config(tmpdir)
-            snapshot = FlightSnapshot(
-                timestamp_sec=time.time(),
-                on_ground=True,
-                elevation_m=100.0,
-                groundspeed_m_s=0.0,
-                indicated_airspeed_kt=0.0,
-                vertical_speed_fpm=0.0,
-            )
-            udp = _FakeUdp([snapshot])
-            speech = _FakeSpeech()
-            team = _LowValueSpeakTeam(speak_now=True)
-
-            runtime = CfiRuntime(
-                cfg,
-                udp_source=udp,
-                speech_sink=speech,
-                team_runner=team,
-            )
-            await runtime.run(duration_sec=0.25)
+        cfg = self.cfg
+        snapshot = FlightSnapshot(
+            timestamp_sec=time.time(),
+            on_ground=True,
+            elevation_m=100.0,
+            groundspeed_m_s=0.0,
+            indicated_airspeed_kt=0.0,
+            vertical_speed_fpm=0.0,
+        )
+        udp = _FakeUdp([snapshot])
+        speech = _FakeSpeech()
+        team = _LowValueSpeakTeam(speak_now=True)
+
+        runtime = CfiRuntime(
+            cfg,
+            udp_source=udp,
+            speech_sink=speech,
+            team_runner=team,
+        )
+        await _run_until(runtime, lambda: _review_settled(runtime, team))
 
-            self.assertEqual(len(speech.nonurgent_calls), 1)  # startup welcome only
-            self.assertNotIn("No evidence of movement detected.", " ".join(speech.nonurgent_calls))
+        self.assertEqual(len(speech.nonurgent_calls), 1)  # startup welcome only
+        self.assertNotIn("No evidence of movement detected.", " ".join(speech.nonurgent_calls))
 
     async def test_robotic_coach_text_humanized(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cfg = _config(tmpdir)
-            snapshot = FlightSnapshot(
-                timestamp_sec=time.time(),
-                on_ground=True,
-                elevation_m=100.0,
-                groundspeed_m_s=0.0,
-                indicated_airspeed_kt=0.0,
+        cfg = self.cfg
+        snapshot = FlightSnapshot(
+            timestamp_sec=time.time(),
+            on_ground=True,
+            elevation_m=100.0,
+            groundspeed_m_s=0.0,
+            indicated_airspeed_kt=0.0,
+            vertical_speed_fpm=0.0,
+        )
+        udp = _FakeUdp([snapshot])
+        speech = _FakeSpeech()
+        team = _RobotToneTeam(speak_now=True)
+
+        runtime = CfiRuntime(
+            cfg,
+            udp_source=udp,
+            speech_sink=speech,
+            team_runner=team,
+        )
+        await _run_until(runtime, lambda: _review_settled(runtime, team))
+
+        coach_calls = [msg for msg in speech.nonurgent_calls if "Welcome to CFI training." not in msg]
+        self.assertGreaterEqual(len(coach_calls), 1)
+        self.assertNotIn("was observed", coach_calls[0].lower())
+
+    async def test_runtime_hazard_phrase_refresh_applies(self) -> None:
+        cfg = replace(
+            self.cfg,
+            hazard_phrase_refresh_sec=0.1,
+            review_tick_sec=0.5,
+        )
+        base = time.time()
+        snapshots = [
+            FlightSnapshot(
+                timestamp_sec=base + 1.0,
+                on_ground=False,
+                indicated_airspeed_kt=45.0,
                 vertical_speed_fpm=0.0,
-            )
-            udp = _FakeUdp([snapshot])
-            speech = _FakeSpeech()
-            team = _RobotToneTeam(speak_now=True)
+            ),
+            FlightSnapshot(
+                timestamp_sec=base + 2.0,
+                on_ground=False,
+                indicated_airspeed_kt=44.0,
+                vertical_speed_fpm=0.0,
+            ),
+            FlightSnapshot(
+                timestamp_sec=base + 3.0,
+                on_ground=False,
+                indicated_airspeed_kt=43.0,
+                vertical_speed_fpm=0.0,
+            ),
+            FlightSnapshot(
+                timestamp_sec=base + 4.0,
+                on_ground=False,
+                indicated_airspeed_kt=42.0,
+                vertical_speed_fpm=0.0,
+            ),
+        ]
+        udp = _StreamingUdp(snapshots)
+        speech = _FakeSpeech()
+        team = _RefreshingTeam()
+
+        runtime = CfiRuntime(
+            cfg,
+            udp_source=udp,
+            speech_sink=speech,
+            team_runner=team,
+        )
+        await _run_until(
+            runtime,
+            lambda: any("Custom runtime phrase" in text for _key, text in speech.urgent_calls),
+        )
 
-            runtime = CfiRuntime(
-                cfg,
-                udp_source=udp,
-                speech_sink=speech,
-                team_runner=team,
-            )
-            await runtime.run(duration_sec=0.25)
+        self.assertGreaterEqual(team.refresh_calls, 1)
+        urgent_texts = [text for _key, text in speech.urgent_calls]
+        self.assertTrue(
+            any("Custom runtime phrase" in text for text in urgent_texts),
+            msg=f"urgent calls: {urgent_texts}",
+        )
 
-            coach_calls = [msg for msg in speech.nonurgent_calls if "Welcome to CFI training." not in msg]
-            self.assertGreaterEqual(len(coach_calls), 1)
-            self.assertNotIn("was observed", coach_calls[0].lower())
+    async def test_startup_retries_speech(self) -> None:
+        cfg = self.cfg
+        snapshot = FlightSnapshot(
+            timestamp_sec=time.time(),
+            on_ground=True,
+            elevation_m=100.0,
+            groundspeed_m_s=0.0,
+            indicated_airspeed_kt=0.0,
+            vertical_speed_fpm=0.0,
+        )
+        udp = _FakeUdp([snapshot])
+        speech = _FlakySpeech(fail_start_attempts=2)
+        team = _FakeTeam(speak_now=False)
+
+        runtime = CfiRuntime(
+            cfg,
+            udp_source=udp,
+            speech_sink=speech,
+            team_runner=team,
+        )
+        await _run_until(runtime, lambda: _review_settled(runtime, team))
+
+        self.assertGreaterEqual(speech.start_attempts, 3)
+
+    async def test_team_decision_labelled_with_reviewed_phase_and_flight(self) -> None:
+        snapshot = FlightSnapshot(
+            timestamp_sec=time.time(),
+            on_ground=True,
+            elevation_m=100.0,
+            groundspeed_m_s=0.0,
+            indicated_airspeed_kt=0.0,
+            vertical_speed_fpm=0.0,
+        )
+        team = _FlightResetDuringReviewTeam()
+        events: list[dict] = []
+        runtime = CfiRuntime(
+            self.cfg,
+            udp_source=_FakeUdp([snapshot]),
+            speech_sink=_FakeSpeech(),
+            team_runner=team,
+            events_sink=events,
+        )
+        team.runtime = runtime
+        await _run_until(runtime, lambda: any(evt.get("event") == "team_decision" for evt in events))
 
-    async def test_runtime_hazard_phrase_refresh_applies(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cfg = _config(tmpdir)
-            cfg = CfiConfig(
-                **{
-                    **cfg.__dict__,
-                    "hazard_phrase_refresh_sec": 0.1,
-                    "review_tick_sec": 0.5,
-                }
-            )
-            base = time.time()
-            snapshots = [
-                FlightSnapshot(
-                    timestamp_sec=base + 1.0,
-                    on_ground=False,
-                    indicated_airspeed_kt=45.0,
-                    vertical_speed_fpm=0.0,
-                ),
-                FlightSnapshot(
-                    timestamp_sec=base + 2.0,
-                    on_ground=False,
-                    indicated_airspeed_kt=44.0,
-                    vertical_speed_fpm=0.0,
-                ),
-                FlightSnapshot(
-                    timestamp_sec=base + 3.0,
-                    on_ground=False,
-                    indicated_airspeed_kt=43.0,
-                    vertical_speed_fpm=0.0,
-                ),
-                FlightSnapshot(
-                    timestamp_sec=base + 4.0,
-                    on_ground=False,
-                    indicated_airspeed_kt=42.0,
-                    vertical_speed_fpm=0.0,
-                ),
-            ]
-            udp = _StreamingUdp(snapshots)
-            speech = _FakeSpeech()
-            team = _RefreshingTeam()
+        decision = next(evt for evt in events if evt.get("event") == "team_decision")
+        self.assertEqual(decision["flight_index"], 1)
+        self.assertEqual(decision["phase"], decision["review_window"]["phase"])
+        self.assertNotEqual(decision["phase"], FlightPhase.CRUISE.value)
 
-            runtime = CfiRuntime(
-                cfg,
-                udp_source=udp,
-                speech_sink=speech,
-                team_runner=team,
-            )
-            await runtime.run(duration_sec=0.7)
+    async def test_shutdown_debrief_logged(self) -> None:
+        cfg = self.cfg
+        snapshot = FlightSnapshot(
+            timestamp_sec=time.time(),
+            on_ground=True,
+            elevation_m=100.0,
+            groundspeed_m_s=0.0,
+            indicated_airspeed_kt=0.0,
+            vertical_speed_fpm=0.0,
+        )
+        udp = _FakeUdp([snapshot])
+        speech = _FakeSpeech()
+        team = _FakeTeam(speak_now=False)
+        sink: list[dict] = []
+
+        runtime = CfiRuntime(
+            cfg,
+            udp_source=udp,
+            speech_sink=speech,
+            team_runner=team,
+            events_sink=sink,
+        )
+        await runtime.run(duration_sec=0.2)
+
+        log_path = Path(cfg.runtime_events_log_path)
+        self.assertTrue(log_path.exists())
+        events = [json.loads(line) for line in log_path.read_text(encoding="utf-8").splitlines() if line.strip()]
+        event_names = {evt.get("event") for evt in events}
+        self.assertIn("shutdown_debrief", event_names)
+        self.assertEqual([evt.get("event") for evt in sink], [evt.get("event") for evt in events])
+
+    async def test_blocked_event_loop_emits_lag_metric(self) -> None:
+        cfg = replace(self.cfg, telemetry_enabled=True)
+        snapshot = FlightSnapshot(
+            timestamp_sec=time.time(),
+            on_ground=True,
+            elevation_m=100.0,
+            groundspeed_m_s=0.0,
+            indicated_airspeed_kt=0.0,
+            vertical_speed_fpm=0.0,
+        )
+        runtime = CfiRuntime(
+            cfg,
+            udp_source=_StallingUdp([snapshot], stall_sec=0.4),
+            speech_sink=_FakeSpeech(),
+            team_runner=_FakeTeam(speak_now=False),
+        )
+        await runtime.run(duration_sec=0.6)
+
+        log_path = Path(cfg.telemetry_log_path)
+        metrics = [json.loads(line) for line in log_path.read_text(encoding="utf-8").splitlines() if line.strip()]
+        lag = [m for m in metrics if m.get("metric") == "event_loop_lag_ms"]
+        self.assertTrue(lag)
+        self.assertGreater(lag[0]["value"], 100.0)
+
+    async def test_slow_awaited_speech_is_not_reported_as_lag(self) -> None:
+        cfg = replace(self.cfg, telemetry_enabled=True)
+        snapshot = FlightSnapshot(
+            timestamp_sec=time.time(),
+            on_ground=False,
+            indicated_airspeed_kt=45.0,
+            vertical_speed_fpm=0.0,
+        )
+        speech = _SlowUrgentSpeech(delay_sec=0.4)
+        runtime = CfiRuntime(
+            cfg,
+            udp_source=_FakeUdp([snapshot]),
+            speech_sink=speech,
+            team_runner=_FakeTeam(speak_now=False),
+        )
+        await runtime.run(duration_sec=0.6)
 
-            self.assertGreaterEqual(team.refresh_calls, 1)
-            urgent_texts = [text for _key, text in speech.urgent_calls]
-            self.assertTrue(
-                any("Custom runtime phrase" in text for text in urgent_texts),
-                msg=f"urgent calls: {urgent_texts}",
-            )
+        log_path = Path(cfg.telemetry_log_path)
+        metrics = [json.loads(line) for line in log_path.read_text(encoding="utf-8").splitlines() if line.strip()]
+        self.assertTrue(speech.urgent_calls)
+        self.assertEqual([m for m in metrics if m.get("metric") == "event_loop_lag_ms"], [])
 
-    async def test_startup_retries_speech(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cfg = _config(tmpdir)
-            snapshot = FlightSnapshot(
-                timestamp_sec=time.time(),
+    async def test_engine_shutdown_auto_debrief_full_flight(self) -> None:
+        cfg = self.cfg
+        base = time.time()
+        snapshots = [
+            FlightSnapshot(
+                timestamp_sec=base + 1.0,
                 on_ground=True,
-                elevation_m=100.0,
                 groundspeed_m_s=0.0,
                 indicated_airspeed_kt=0.0,
+                throttle_ratio=0.4,
+                parking_brake_ratio=0.0,
+                engine_running=True,
+                engine_rpm=900.0,
+            ),
+            FlightSnapshot(
+                timestamp_sec=base + 2.0,
+                on_ground=False,
+                groundspeed_m_s=35.0,
+                indicated_airspeed_kt=80.0,
+                throttle_ratio=1.0,
+                vertical_speed_fpm=700.0,
+                engine_running=True,
+                engine_rpm=2500.0,
+            ),
+            FlightSnapshot(
+                timestamp_sec=base + 3.0,
+                on_ground=False,
+                groundspeed_m_s=45.0,
+                indicated_airspeed_kt=95.0,
+                throttle_ratio=0.6,
                 vertical_speed_fpm=0.0,
-            )
-            udp = _FakeUdp([snapshot])
-            speech = _FlakySpeech(fail_start_attempts=2)
-            team = _FakeTeam(speak_now=False)
-
-            runtime = CfiRuntime(
-                cfg,
-                udp_source=udp,
-                speech_sink=speech,
-                team_runner=team,
-            )
-            await runtime.run(duration_sec=0.25)
-
-            self.assertGreaterEqual(speech.start_attempts, 3)
-
-    async def test_shutdown_debrief_logged(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cfg = _config(tmpdir)
-            snapshot = FlightSnapshot(
-                timestamp_sec=time.time(),
+                engine_running=True,
+                engine_rpm=2300.0,
+            ),
+            FlightSnapshot(
+                timestamp_sec=base + 4.0,
+                on_ground=True,
+                groundspeed_m_s=4.5,
+                indicated_airspeed_kt=9.0,
+                throttle_ratio=0.2,
+                parking_brake_ratio=0.1,
+                engine_running=True,
+                engine_rpm=1000.0,
+            ),
+            FlightSnapshot(
+                timestamp_sec=base + 5.0,
                 on_ground=True,
-                elevation_m=100.0,
                 groundspeed_m_s=0.0,
                 indicated_airspeed_kt=0.0,
-                vertical_speed_fpm=0.0,
-            )
-            udp = _FakeUdp([snapshot])
-            speech = _FakeSpeech()
-            team = _FakeTeam(speak_now=False)
-
-            runtime = CfiRuntime(
-                cfg,
-                udp_source=udp,
-                speech_sink=speech,
-                team_runner=team,
-            )
-            await runtime.run(duration_sec=0.2)
-
-            log_path = Path(cfg.runtime_events_log_path)
-            self.assertTrue(log_path.exists())
-            events = [json.loads(line) for line in log_path.read_text(encoding="utf-8").splitlines() if line.strip()]
-            event_names = {evt.get("event") for evt in events}
-            self.assertIn("shutdown_debrief", event_names)
-
-    async def test_engine_shutdown_auto_debrief_full_flight(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cfg = _config(tmpdir)
-            cfg = CfiConfig(
-                **{
-                    **cfg.__dict__,
-                    "shutdown_detect_dwell_sec": 0.1,
-                    "review_tick_sec": 0.5,
-                    "review_window_sec": 0.5,
-                }
+                throttle_ratio=0.05,
+                parking_brake_ratio=1.0,
+                engine_running=False,
+                engine_rpm=0.0,
+            ),
+            FlightSnapshot(
+                timestamp_sec=base + 6.0,
+                on_ground=True,
+                groundspeed_m_s=0.0,
+                indicated_airspeed_kt=0.0,
+                throttle_ratio=0.05,
+                parking_brake_ratio=1.0,
+                engine_running=False,
+                engine_rpm=0.0,
+            ),
+        ]
+
+        udp = _StreamingUdp(snapshots)
+        speech = _FakeSpeech()
+        team = _FakeTeam(speak_now=False)
+        events: list[dict] = []
+        runtime = CfiRuntime(
+            cfg,
+            udp_source=udp,
+            speech_sink=speech,
+            team_runner=team,
+            events_sink=events,
+        )
+        await _run_until(runtime, lambda: sum(evt.get("event") == "shutdown_debrief" for evt in events) >= 1)
+        names = [evt.get("event") for evt in events]
+        self.assertIn("engine_shutdown_detected", names)
+
+        debriefs = [evt for evt in events if evt.get("event") == "shutdown_debrief"]
+        self.assertEqual(len(debriefs), 1)
+        self.assertEqual(debriefs[0].get("reason"), "engine_shutdown_detected")
+        self.assertEqual(debriefs[0]["review_window"]["sample_count"], len(snapshots))
+
+    async def test_slow_review_does_not_block_engine_shutdown_debrief(self) -> None:
+        cfg = self.cfg
+        base = time.time()
+        snapshots = [
+            FlightSnapshot(
+                timestamp_sec=base + 1.0,
+                on_ground=True,
+                groundspeed_m_s=0.0,
+                throttle_ratio=0.4,
+                engine_running=True,
+                engine_rpm=900.0,
+            ),
+            FlightSnapshot(
+                timestamp_sec=base + 2.0,
+                on_ground=False,
+                groundspeed_m_s=35.0,
+                indicated_airspeed_kt=80.0,
+                throttle_ratio=1.0,
+                vertical_speed_fpm=700.0,
+                engine_running=True,
+                engine_rpm=2500.0,
+            ),
+            FlightSnapshot(
+                timestamp_sec=base + 3.0,
+                on_ground=False,
+                groundspeed_m_s=45.0,
+                indicated_airspeed_kt=95.0,
+                throttle_ratio=0.6,
+                engine_running=True,
+                engine_rpm=2300.0,
+            ),
+            FlightSnapshot(
+                timestamp_sec=base + 4.0,
+                on_ground=True,
+                groundspeed_m_s=4.5,
+                indicated_airspeed_kt=9.0,
+                throttle_ratio=0.2,
+                engine_running=True,
+                engine_rpm=1000.0,
+            ),
+            FlightSnapshot(
+                timestamp_sec=base + 5.0,
+                on_ground=True,
+                groundspeed_m_s=0.0,
+                throttle_ratio=0.05,
+                parking_brake_ratio=1.0,
+                engine_running=False,
+                engine_rpm=0.0,
+            ),
+            FlightSnapshot(
+                timestamp_sec=base + 6.0,
+                on_ground=True,
+                groundspeed_m_s=0.0,
+                throttle_ratio=0.05,
+                parking_brake_ratio=1.0,
+                engine_running=False,
+                engine_rpm=0.0,
+            ),
+        ]
+        udp = _StreamingUdp(snapshots)
+        speech = _FakeSpeech()
+        team = _SlowFirstReviewTeam(speak_now=False)
+        events: list[dict] = []
+        runtime = CfiRuntime(
+            cfg,
+            udp_source=udp,
+            speech_sink=speech,
+            team_runner=team,
+            events_sink=events,
+        )
+        started = time.monotonic()
+        await _run_until(runtime, lambda: sum(evt.get("event") == "shutdown_debrief" for evt in events) >= 1)
+        self.assertLess(time.monotonic() - started, 2.0)
+
+        debriefs = [evt for evt in events if evt.get("event") == "shutdown_debrief"]
+        self.assertEqual(len(debriefs), 1)
+        self.assertEqual(debriefs[0].get("reason"), "engine_shutdown_detected")
+        self.assertEqual(debriefs[0]["review_window"]["sample_count"], len(snapshots))
+
+    async def test_udp_snapshot_wakes_runtime_loop(self) -> None:
+        with (
+            socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as xplane,
+            # Push every runtime timer out of reach so only a datagram can wake the loop.
+            mock.patch("cfi_ai.runtime.LOG_FLUSH_INTERVAL_SEC", 60.0),
+        ):
+            xplane.bind(("127.0.0.1", 0))
+            cfg = replace(
+                self.cfg,
+                xplane_udp_port=xplane.getsockname()[1],
+                xplane_udp_local_port=0,
+                review_tick_sec=60.0,
+                hazard_phrase_refresh_sec=60.0,
             )
-            base = time.time()
-            snapshots = [
-                FlightSnapshot(
-                    timestamp_sec=base + 1.0,
-                    on_ground=True,
-                    groundspeed_m_s=0.0,
-                    indicated_airspeed_kt=0.0,
-                    throttle_ratio=0.4,
-                    parking_brake_ratio=0.0,
-                    engine_running=True,
-                    engine_rpm=900.0,
-                ),
-                FlightSnapshot(
-                    timestamp_sec=base + 2.0,
-                    on_ground=False,
-                    groundspeed_m_s=35.0,
-                    indicated_airspeed_kt=80.0,
-                    throttle_ratio=1.0,
-                    vertical_speed_fpm=700.0,
-                    engine_running=True,
-                    engine_rpm=2500.0,
-                ),
-                FlightSnapshot(
-                    timestamp_sec=base + 3.0,
-                    on_ground=False,
-                    groundspeed_m_s=45.0,
-                    indicated_airspeed_kt=95.0,
-                    throttle_ratio=0.6,
-                    vertical_speed_fpm=0.0,
-                    engine_running=True,
-                    engine_rpm=2300.0,
-                ),
-                FlightSnapshot(
-                    timestamp_sec=base + 4.0,
-                    on_ground=True,
-                    groundspeed_m_s=4.5,
-                    indicated_airspeed_kt=9.0,
-                    throttle_ratio=0.2,
-                    parking_brake_ratio=0.1,
-                    engine_running=True,
-                    engine_rpm=1000.0,
-                ),
-                FlightSnapshot(
-                    timestamp_sec=base + 5.0,
-                    on_ground=True,
-                    groundspeed_m_s=0.0,
-                    indicated_airspeed_kt=0.0,
-                    throttle_ratio=0.05,
-                    parking_brake_ratio=1.0,
-                    engine_running=False,
-                    engine_rpm=0.0,
-                ),
-                FlightSnapshot(
-                    timestamp_sec=base + 6.0,
-                    on_ground=True,
-                    groundspeed_m_s=0.0,
-                    indicated_airspeed_kt=0.0,
-                    throttle_ratio=0.05,
-                    parking_brake_ratio=1.0,
-                    engine_running=False,
-                    engine_rpm=0.0,
-                ),
-            ]
-
-            udp = _StreamingUdp(snapshots)
             speech = _FakeSpeech()
-            team = _FakeTeam(speak_now=False)
-            runtime = CfiRuntime(
-                cfg,
-                udp_source=udp,
-                speech_sink=speech,
-                team_runner=team,
+            runtime = CfiRuntime(cfg, speech_sink=speech, team_runner=_FakeTeam(speak_now=False))
+            run_task = asyncio.create_task(runtime.run())
+
+            await _wait_until(lambda: speech.nonurgent_calls, timeout=2.0)
+            local_addr = runtime._udp._socket.getsockname()
+            await asyncio.sleep(0.1)
+            self.assertFalse(run_task.done())
+            self.assertEqual(speech.urgent_calls, [])
+
+            payload = (
+                b"RREF,"
+                + struct.pack("<if", INDEX_BY_KEY["indicated_airspeed_kt"], 45.0)
+                + struct.pack("<if", INDEX_BY_KEY["vertical_speed_fpm"], -200.0)
+                + struct.pack("<if", INDEX_BY_KEY["on_ground"], 0.0)
             )
-            await runtime.run(duration_sec=0.6)
-
-            events = [
-                json.loads(line)
-                for line in Path(cfg.runtime_events_log_path).read_text(encoding="utf-8").splitlines()
-                if line.strip()
-            ]
-            names = [evt.get("event") for evt in events]
-            self.assertIn("engine_shutdown_detected", names)
+            xplane.sendto(payload, local_addr)
+            await _wait_until(lambda: speech.urgent_calls, timeout=2.0)
 
-            debriefs = [evt for evt in events if evt.get("event") == "shutdown_debrief"]
-            self.assertEqual(len(debriefs), 1)
-            self.assertEqual(debriefs[0].get("reason"), "engine_shutdown_detected")
-            self.assertEqual(debriefs[0]["review_window"]["sample_count"], len(snapshots))
+            # The stop request is only seen once the loop wakes, which the next datagram does.
+            runtime.request_stop()
+            xplane.sendto(payload, local_addr)
+            await asyncio.wait_for(run_task, timeout=2.0)
 
     async def test_multiple_flights_in_one_daemon_run(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cfg = _config(tmpdir)
-            cfg = CfiConfig(
-                **{
-                    **cfg.__dict__,
-                    "shutdown_detect_dwell_sec": 0.1,
-                    "review_tick_sec": 0.5,
-                    "review_window_sec": 0.5,
-                }
-            )
-            base = time.time()
-            snapshots = [
-                # Flight 1
-                FlightSnapshot(
-                    timestamp_sec=base + 1.0,
-                    on_ground=True,
-                    groundspeed_m_s=0.0,
-                    indicated_airspeed_kt=0.0,
-                    throttle_ratio=0.4,
-                    parking_brake_ratio=0.0,
-                    engine_running=True,
-                    engine_rpm=900.0,
-                ),
-                FlightSnapshot(
-                    timestamp_sec=base + 2.0,
-                    on_ground=False,
-                    groundspeed_m_s=35.0,
-                    indicated_airspeed_kt=80.0,
-                    throttle_ratio=1.0,
-                    vertical_speed_fpm=600.0,
-                    engine_running=True,
-                    engine_rpm=2400.0,
-                ),
-                FlightSnapshot(
-                    timestamp_sec=base + 3.0,
-                    on_ground=True,
-                    groundspeed_m_s=0.0,
-                    indicated_airspeed_kt=0.0,
-                    throttle_ratio=0.05,
-                    parking_brake_ratio=1.0,
-                    engine_running=False,
-                    engine_rpm=0.0,
-                ),
-                FlightSnapshot(
-                    timestamp_sec=base + 4.0,
-                    on_ground=True,
-                    groundspeed_m_s=0.0,
-                    indicated_airspeed_kt=0.0,
-                    throttle_ratio=0.05,
-                    parking_brake_ratio=1.0,
-                    engine_running=False,
-                    engine_rpm=0.0,
-                ),
-                # Flight 2 start activity after shutdown
-                FlightSnapshot(
-                    timestamp_sec=base + 5.0,
-                    on_ground=True,
-                    groundspeed_m_s=0.0,
-                    indicated_airspeed_kt=0.0,
-                    throttle_ratio=0.35,
-                    parking_brake_ratio=0.0,
-                    engine_running=True,
-                    engine_rpm=1000.0,
-                ),
-                FlightSnapshot(
-                    timestamp_sec=base + 6.0,
-                    on_ground=False,
-                    groundspeed_m_s=30.0,
-                    indicated_airspeed_kt=75.0,
-                    throttle_ratio=0.9,
-                    vertical_speed_fpm=500.0,
-                    engine_running=True,
-                    engine_rpm=2300.0,
-                ),
-                FlightSnapshot(
-                    timestamp_sec=base + 7.0,
-                    on_ground=True,
-                    groundspeed_m_s=0.0,
-                    indicated_airspeed_kt=0.0,
-                    throttle_ratio=0.05,
-                    parking_brake_ratio=1.0,
-                    engine_running=False,
-                    engine_rpm=0.0,
-                ),
-                FlightSnapshot(
-                    timestamp_sec=base + 8.0,
-                    on_ground=True,
-                    groundspeed_m_s=0.0,
-                    indicated_airspeed_kt=0.0,
-                    throttle_ratio=0.05,
-                    parking_brake_ratio=1.0,
-                    engine_running=False,
-                    engine_rpm=0.0,
-                ),
-            ]
-
-            udp = _StreamingUdp(snapshots)
-            speech = _FakeSpeech()
-            team = _FakeTeam(speak_now=False)
-            runtime = CfiRuntime(
-                cfg,
-                udp_source=udp,
-                speech_sink=speech,
-                team_runner=team,
-            )
-            await runtime.run(duration_sec=0.9)
-
-            events = [
-                json.loads(line)
-                for line in Path(cfg.runtime_events_log_path).read_text(encoding="utf-8").splitlines()
-                if line.strip()
-            ]
+        cfg = self.cfg
+        base = time.time()
+        snapshots = [
+            # Flight 1
+            FlightSnapshot(
+                timestamp_sec=base + 1.0,
+                on_ground=True,
+                groundspeed_m_s=0.0,
+                indicated_airspeed_kt=0.0,
+                throttle_ratio=0.4,
+                parking_brake_ratio=0.0,
+                engine_running=True,
+                engine_rpm=900.0,
+            ),
+            FlightSnapshot(
+                timestamp_sec=base + 2.0,
+                on_ground=False,
+                groundspeed_m_s=35.0,
+                indicated_airspeed_kt=80.0,
+                throttle_ratio=1.0,
+                vertical_speed_fpm=600.0,
+                engine_running=True,
+                engine_rpm=2400.0,
+            ),
+            FlightSnapshot(
+                timestamp_sec=base + 3.0,
+                on_ground=True,
+                groundspeed_m_s=0.0,
+                indicated_airspeed_kt=0.0,
+                throttle_ratio=0.05,
+                parking_brake_ratio=1.0,
+                engine_running=False,
+                engine_rpm=0.0,
+            ),
+            FlightSnapshot(
+                timestamp_sec=base + 4.0,
+                on_ground=True,
+                groundspeed_m_s=0.0,
+                indicated_airspeed_kt=0.0,
+                throttle_ratio=0.05,
+                parking_brake_ratio=1.0,
+                engine_running=False,
+                engine_rpm=0.0,
+            ),
+            # Flight 2 start activity after shutdown
+            FlightSnapshot(
+                timestamp_sec=base + 5.0,
+                on_ground=True,
+                groundspeed_m_s=0.0,
+                indicated_airspeed_kt=0.0,
+                throttle_ratio=0.35,
+                parking_brake_ratio=0.0,
+                engine_running=True,
+                engine_rpm=1000.0,
+            ),
+            FlightSnapshot(
+                timestamp_sec=base + 6.0,
+                on_ground=False,
+                groundspeed_m_s=30.0,
+                indicated_airspeed_kt=75.0,
+                throttle_ratio=0.9,
+                vertical_speed_fpm=500.0,
+                engine_running=True,
+                engine_rpm=2300.0,
+            ),
+            FlightSnapshot(
+                timestamp_sec=base + 7.0,
+                on_ground=True,
+                groundspeed_m_s=0.0,
+                indicated_airspeed_kt=0.0,
+                throttle_ratio=0.05,
+                parking_brake_ratio=1.0,
+                engine_running=False,
+                engine_rpm=0.0,
+            ),
+            FlightSnapshot(
+                timestamp_sec=base + 8.0,
+                on_ground=True,
+                groundspeed_m_s=0.0,
+                indicated_airspeed_kt=0.0,
+                throttle_ratio=0.05,
+                parking_brake_ratio=1.0,
+                engine_running=False,
+                engine_rpm=0.0,
+            ),
+        ]
+
+        udp = _StreamingUdp(snapshots)
+        speech = _FakeSpeech()
+        team = _FakeTeam(speak_now=False)
+        events: list[dict] = []
+        runtime = CfiRuntime(
+            cfg,
+            udp_source=udp,
+            speech_sink=speech,
+            team_runner=team,
+            events_sink=events,
+        )
+        await _run_until(runtime, lambda: sum(evt.get("event") == "shutdown_debrief" for evt in events) >= 2)
 
-            shutdown_detected = [evt for evt in events if evt.get("event") == "engine_shutdown_detected"]
-            self.assertEqual(len(shutdown_detected), 2)
+        shutdown_detected = [evt for evt in events if evt.get("event") == "engine_shutdown_detected"]
+        self.assertEqual(len(shutdown_detected), 2)
 
-            debriefs = [evt for evt in events if evt.get("event") == "shutdown_debrief"]
-            self.assertEqual(len(debriefs), 2)
-            self.assertEqual({evt.get("flight_index") for evt in debriefs}, {1, 2})
+        debriefs = [evt for evt in events if evt.get("event") == "shutdown_debrief"]
+        self.assertEqual(len(debriefs), 2)
+        self.assertEqual({evt.get("flight_index") for evt in debriefs}, {1, 2})
 
-            cycle_starts = [evt for evt in events if evt.get("event") == "flight_cycle_started"]
-            self.assertEqual(len(cycle_starts), 1)
-            self.assertEqual(cycle_starts[0].get("flight_index"), 2)
+        cycle_starts = [evt for evt in events if evt.get("event") == "flight_cycle_started"]
+        self.assertEqual(len(cycle_starts), 1)
+        self.assertEqual(cycle_starts[0].get("flight_index"), 2)
 
 
 if __name__ == "__main__":
@@ -1,31 +1,59 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import random
+import socket
 import struct
 import sys
 import unittest
 from pathlib import Path
+from unittest import mock
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
 from cfi_ai.xplane_udp import (
     BEACON_PREFIX,
+    DATAREF_BY_KEY,
+    INDEX_BY_KEY,
+    XPlaneUdpClient,
     build_rref_request_packet,
+    build_rref_request_packets,
     parse_beacon_datagram,
     parse_rref_datagram,
 )
 
+# Wire layout of an RREF subscription request: header, frequency, index, NUL-padded dataref.
+_RREF_REQUEST_LAYOUT = struct.Struct("<5sii400s")
+
 
 class TestUdpPackets(unittest.TestCase):
     def test_build_rref_request_packet_shape(self) -> None:
         packet = build_rref_request_packet(freq_hz=10, index=7, dataref="sim/test/dataref")
-        self.assertEqual(len(packet), 413)
+        self.assertEqual(len(packet), _RREF_REQUEST_LAYOUT.size)
+        self.assertEqual(_RREF_REQUEST_LAYOUT.size, 413)
 
-        header, freq, idx, raw_dataref = struct.unpack("<5sii400s", packet)
+        header, freq, idx, raw_dataref = _RREF_REQUEST_LAYOUT.unpack(packet)
         self.assertEqual(header, b"RREF\x00")
         self.assertEqual(freq, 10)
         self.assertEqual(idx, 7)
         self.assertTrue(raw_dataref.startswith(b"sim/test/dataref"))
 
+    def test_build_rref_request_packet_keeps_long_dataref_terminated(self) -> None:
+        packet = build_rref_request_packet(freq_hz=10, index=1, dataref="x" * 500)
+        _, _, _, raw_dataref = _RREF_REQUEST_LAYOUT.unpack(packet)
+        self.assertEqual(raw_dataref, b"x" * 399 + b"\x00")
+
+    def test_build_rref_request_packets_matches_single_packets(self) -> None:
+        subscriptions = [(idx, f"sim/test/dataref_{idx}") for idx in range(1, 65)]
+        packets = build_rref_request_packets(10, subscriptions)
+        self.assertEqual(len(packets), len(subscriptions))
+        for packet, (idx, dataref) in zip(packets, subscriptions):
+            self.assertEqual(len(packet), _RREF_REQUEST_LAYOUT.size)
+            self.assertIsInstance(packet, bytes)
+            self.assertEqual(packet, build_rref_request_packet(freq_hz=10, index=idx, dataref=dataref))
+        self.assertEqual(build_rref_request_packets(10, []), [])
+
     def test_parse_rref_datagram(self) -> None:
         payload = b"RREF," + struct.pack("<if", 1, 123.5) + struct.pack("<if", 2, -4.25)
         parsed = parse_rref_datagram(payload)
@@ -34,10 +62,39 @@ class TestUdpPackets(unittest.TestCase):
         self.assertAlmostEqual(parsed[1], 123.5, places=5)
         self.assertAlmostEqual(parsed[2], -4.25, places=5)
 
+    def test_parse_rref_datagram_sizes(self) -> None:
+        entry = struct.Struct("<if")
+        for count in (1, 2, 64, 1024):
+            with self.subTest(count=count):
+                payload = b"RREF," + b"".join(entry.pack(i, i * 0.5) for i in range(count))
+                self.assertEqual(parse_rref_datagram(payload), {i: i * 0.5 for i in range(count)})
+
+    def test_parse_rref_accepts_buffer_views(self) -> None:
+        payload = b"RREF," + struct.pack("<if", 1, 123.5) + struct.pack("<if", 2, -4.25)
+        expected = parse_rref_datagram(payload)
+        self.assertEqual(parse_rref_datagram(memoryview(payload)), expected)
+        self.assertEqual(parse_rref_datagram(bytearray(payload)), expected)
+        self.assertEqual(parse_rref_datagram(memoryview(b"NOPE")), {})
+
+    def test_parse_rref_ignores_trailing_partial_entry(self) -> None:
+        payload = b"RREF," + struct.pack("<if", 3, 7.0) + b"\x01\x02\x03"
+        self.assertEqual(parse_rref_datagram(payload), {3: 7.0})
+        self.assertEqual(parse_rref_datagram(b"RREF,"), {})
+
     def test_parse_rref_invalid_prefix(self) -> None:
         parsed = parse_rref_datagram(b"NOPE")
         self.assertEqual(parsed, {})
 
+    def test_parse_rref_rejects_random_prefixes(self) -> None:
+        rng = random.Random(15)
+        entry = struct.pack("<if", 1, 2.0)
+        for _ in range(200):
+            prefix = rng.randbytes(5)
+            if prefix == b"RREF,":
+                continue
+            self.assertEqual(parse_rref_datagram(prefix + entry), {}, prefix)
+        self.assertEqual(parse_rref_datagram(b"RREF"), {})
+
     def test_parse_beacon_datagram(self) -> None:
         # BECN body: byte, byte, int, int, int, ushort, name...
         body = struct.pack("<BBiiiH", 1, 2, 12345, 120000, 1, 49000) + b"MyXPlane\x00"
@@ -47,6 +104,160 @@ class TestUdpPackets(unittest.TestCase):
 
     def test_parse_beacon_invalid(self) -> None:
         self.assertIsNone(parse_beacon_datagram(b"NOPE", sender_ip="192.168.1.1"))
+        truncated = BEACON_PREFIX + struct.pack("<BBiiiH", 1, 2, 12345, 120000, 1, 49000)[:-1]
+        self.assertIsNone(parse_beacon_datagram(truncated, sender_ip="192.168.1.1"))
+
+
+def _client(**overrides) -> XPlaneUdpClient:
+    kwargs = dict(
+        xplane_host="127.0.0.1",
+        xplane_port=49000,
+        discovery_enabled=False,
+        beacon_multicast_group="239.255.1.1",
+        beacon_port=49707,
+        beacon_timeout_sec=1.0,
+        local_port=0,
+        rref_hz=10,
+        local_host="127.0.0.1",
+    )
+    kwargs.update(overrides)
+    return XPlaneUdpClient(**kwargs)
+
+
+class TestUdpSnapshotMapping(unittest.TestCase):
+    def test_every_subscribed_dataref_maps_to_its_snapshot_field(self) -> None:
+        client = _client()
+        continuous = {
+            key: float(idx) * 1.5
+            for key, idx in INDEX_BY_KEY.items()
+            if key not in {"engine_running", "on_ground", "stall_warning", "com1_hz"}
+        }
+        payload = b"RREF," + b"".join(struct.pack("<if", INDEX_BY_KEY[k], v) for k, v in continuous.items())
+        payload += struct.pack("<if", INDEX_BY_KEY["engine_running"], 1.0)
+        payload += struct.pack("<if", INDEX_BY_KEY["on_ground"], 1.0)
+        payload += struct.pack("<if", INDEX_BY_KEY["com1_hz"], 122800.0)
+        payload += struct.pack("<if", 999, 5.0)
+        self.assertTrue(client._apply_datagram(payload))
+
+        snapshot = client._build_snapshot(10.0)
+        for key, value in continuous.items():
+            self.assertEqual(getattr(snapshot, key), value, key)
+        self.assertTrue(snapshot.engine_running)
+        self.assertTrue(snapshot.on_ground)
+        self.assertFalse(snapshot.stall_warning)
+        self.assertEqual(snapshot.com1_hz, 122800)
+
+    def test_unset_datarefs_stay_none(self) -> None:
+        snapshot = _client()._build_snapshot(10.0)
+        self.assertIsNone(snapshot.indicated_airspeed_kt)
+        self.assertIsNone(snapshot.engine_running)
+        self.assertFalse(snapshot.on_ground)
+
+
+class TestUdpReceive(unittest.IsolatedAsyncioTestCase):
+    async def test_queued_datagrams_fold_into_one_snapshot(self) -> None:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as xplane:
+            xplane.bind(("127.0.0.1", 0))
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as probe:
+                probe.bind(("127.0.0.1", 0))
+                local_port = probe.getsockname()[1]
+            client = _client(xplane_port=xplane.getsockname()[1], local_port=local_port)
+            await client.start()
+            try:
+                # Queue all three before the receive task gets to run.
+                for key, value in (("indicated_airspeed_kt", 80.0), ("roll_deg", 12.0), ("on_ground", 1.0)):
+                    xplane.sendto(b"RREF," + struct.pack("<if", INDEX_BY_KEY[key], value), ("127.0.0.1", local_port))
+                await client.wait_for_snapshot(1.0)
+                await asyncio.sleep(0.05)
+            finally:
+                await client.stop()
+
+        snapshots = client.window(60.0)
+        self.assertEqual(len(snapshots), 1)
+        self.assertEqual(snapshots[0].indicated_airspeed_kt, 80.0)
+        self.assertEqual(snapshots[0].roll_deg, 12.0)
+        self.assertTrue(snapshots[0].on_ground)
+
+    async def test_subscribe_and_unsubscribe_send_every_dataref(self) -> None:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as xplane:
+            xplane.bind(("127.0.0.1", 0))
+            xplane.settimeout(1.0)
+            client = _client(xplane_port=xplane.getsockname()[1])
+            await client.start()
+            await client.stop()
+
+            requests = [_RREF_REQUEST_LAYOUT.unpack(xplane.recvfrom(4096)[0]) for _ in range(2 * len(DATAREF_BY_KEY))]
+
+        subscribe, unsubscribe = requests[: len(DATAREF_BY_KEY)], requests[len(DATAREF_BY_KEY) :]
+        self.assertEqual({freq for _, freq, _, _ in subscribe}, {10})
+        self.assertEqual({freq for _, freq, _, _ in unsubscribe}, {0})
+        self.assertEqual([idx for _, _, idx, _ in subscribe], sorted(INDEX_BY_KEY.values()))
+        self.assertEqual([idx for _, _, idx, _ in unsubscribe], sorted(INDEX_BY_KEY.values()))
+
+    async def test_resubscribes_only_when_stream_goes_stale(self) -> None:
+        with (
+            socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as xplane,
+            mock.patch("cfi_ai.xplane_udp.RX_STALE_SEC", 0.15),
+            mock.patch("cfi_ai.xplane_udp.RESUBSCRIBE_CHECK_SEC", 0.02),
+        ):
+            xplane.bind(("127.0.0.1", 0))
+            xplane.setblocking(False)
+            client = _client(xplane_port=xplane.getsockname()[1])
+            await client.start()
+            try:
+                local_addr = client._socket.getsockname()
+
+                def drain_requests() -> int:
+                    count = 0
+                    while True:
+                        try:
+                            xplane.recvfrom(4096)
+                        except BlockingIOError:
+                            return count
+                        count += 1
+
+                self.assertEqual(drain_requests(), len(DATAREF_BY_KEY))
+                datagram = b"RREF," + struct.pack("<if", INDEX_BY_KEY["roll_deg"], 1.0)
+                for _ in range(15):
+                    xplane.sendto(datagram, local_addr)
+                    await asyncio.sleep(0.02)
+                self.assertEqual(drain_requests(), 0)
+
+                await asyncio.sleep(0.3)
+                self.assertGreaterEqual(drain_requests(), len(DATAREF_BY_KEY))
+            finally:
+                await client.stop()
+
+    async def test_periodic_resubscribe_while_streaming(self) -> None:
+        with (
+            socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as xplane,
+            mock.patch("cfi_ai.xplane_udp.RESUBSCRIBE_REFRESH_SEC", 0.15),
+            mock.patch("cfi_ai.xplane_udp.RESUBSCRIBE_CHECK_SEC", 0.02),
+        ):
+            xplane.bind(("127.0.0.1", 0))
+            xplane.settimeout(2.0)
+            client = _client(xplane_port=xplane.getsockname()[1])
+            await client.start()
+            try:
+                local_addr = client._socket.getsockname()
+                for _ in range(len(DATAREF_BY_KEY)):
+                    xplane.recvfrom(4096)
+
+                # Keep one dataref streaming; a dropped subscription must still be re-requested.
+                datagram = b"RREF," + struct.pack("<if", INDEX_BY_KEY["roll_deg"], 1.0)
+                for _ in range(15):
+                    xplane.sendto(datagram, local_addr)
+                    await asyncio.sleep(0.02)
+                xplane.setblocking(False)
+                resent = []
+                with contextlib.suppress(BlockingIOError):
+                    while True:
+                        resent.append(_RREF_REQUEST_LAYOUT.unpack(xplane.recvfrom(4096)[0])[2])
+            finally:
+                await client.stop()
+
+        self.assertGreaterEqual(len(resent), len(DATAREF_BY_KEY))
+        self.assertEqual(set(resent), set(INDEX_BY_KEY.values()))
 
 
 if __name__ == "__main__":